@@ -115,6 +115,20 @@ class MetaData(object):
         "USE_COLORS": "on",
         "DOWNDER": "wget",
         "DOWNDER_OPTIONS": "-c -N",
+        "DOWNLOADS": "4",
+        "HOST_DOWNLOADS": "2",
+        "UPDATE_WORKERS": "4",
+        "BUILD_WORKERS": "1",
+        "PREFETCH": "2",
+        "PREFETCH_SPACE": "1024",
+        "SOURCE_CACHE": "/var/cache/slpkg/sources/",
+        "SOURCE_CACHE_SIZE": "4096",
+        "PACKAGES_CACHE_SIZE": "2048",
+        "TRANSACTION": "on",
+        "HEALTH_WORKERS": "8",
+        "UPDATE_TIMEOUT": "600",
+        "INCREMENTAL": "off",
+        "COMPRESSED": "on",
         "SLACKPKG_LOG": "on",
         "ONLY_INSTALLED": "off",
         "PRG_BAR": "on",
@@ -157,6 +171,20 @@ class MetaData(object):
     use_colors = _conf_slpkg["USE_COLORS"]
     downder = _conf_slpkg["DOWNDER"]
     downder_options = _conf_slpkg["DOWNDER_OPTIONS"]
+    downloads = _conf_slpkg["DOWNLOADS"]
+    host_downloads = _conf_slpkg["HOST_DOWNLOADS"]
+    update_workers = _conf_slpkg["UPDATE_WORKERS"]
+    build_workers = _conf_slpkg["BUILD_WORKERS"]
+    prefetch = _conf_slpkg["PREFETCH"]
+    prefetch_space = _conf_slpkg["PREFETCH_SPACE"]
+    source_cache = _conf_slpkg["SOURCE_CACHE"]
+    source_cache_size = _conf_slpkg["SOURCE_CACHE_SIZE"]
+    packages_cache_size = _conf_slpkg["PACKAGES_CACHE_SIZE"]
+    transaction = _conf_slpkg["TRANSACTION"]
+    health_workers = _conf_slpkg["HEALTH_WORKERS"]
+    update_timeout = _conf_slpkg["UPDATE_TIMEOUT"]
+    incremental = _conf_slpkg["INCREMENTAL"]
+    compressed = _conf_slpkg["COMPRESSED"]
     slackpkg_log = _conf_slpkg["SLACKPKG_LOG"]
     only_installed = _conf_slpkg["ONLY_INSTALLED"]
     prg_bar = _conf_slpkg["PRG_BAR"]
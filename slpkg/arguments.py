@@ -58,7 +58,7 @@ Commands:
                                             repository.
    update slpkg                             Upgrade the program directly from
                                             repository.
-   health, --silent                         Health check installed packages.
+   health, --silent, --incremental          Health check installed packages.
    deps-status, --tree, --graph=[type]      Print dependencies status used by
                                             packages or drawing dependencies
                                             diagram.
@@ -145,7 +145,7 @@ def usage(repo):
              [repo-list]
              [repo-info [repository]]
              [update [slpkg]]
-             [health, --silent]
+             [health, --silent, --incremental]
              [deps-status, --tree, --graph=[type]]
              [new-config]
 
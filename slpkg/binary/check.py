@@ -40,31 +40,44 @@ def pkg_upgrade(repo, skip, flag):
     """Checking packages for upgrade
     """
     Msg().checking()
-    PACKAGES_TXT = RepoInit(repo).fetch()[0]
     pkgs_for_upgrade = []
     # name = data[0]
     # location = data[1]
     # size = data[2]
     # unsize = data[3]
-    data = repo_data(PACKAGES_TXT, repo, flag="")
+    data = repo_data(RepoInit(repo).fetch()[0], repo)
+    candidates = repo_candidates(data[0])
     for pkg in installed():
-        status(0.0005)
+        status()
         inst_pkg = split_package(pkg)
-        for name in data[0]:
-            if name:    # this tips because some pkg_name is empty
-                repo_pkg = split_package(name[:-4])
-            if (repo_pkg[0] == inst_pkg[0] and
-                LooseVersion(repo_pkg[1]) > LooseVersion(inst_pkg[1]) and
-                repo_pkg[3] >= inst_pkg[3] and
-                    inst_pkg[0] not in skip and
-                    repo_pkg[1] != "blacklist"):
-                pkgs_for_upgrade.append(repo_pkg[0])
+        if not inst_pkg[0] or inst_pkg[0] in skip:
+            continue
+        inst_ver = LooseVersion(inst_pkg[1])
+        for ver, build in candidates.get(inst_pkg[0], []):
+            if (ver > inst_ver and build >= inst_pkg[3] and
+                    ver.vstring != "blacklist"):
+                pkgs_for_upgrade.append(inst_pkg[0])
+                break
     Msg().done()
     if "--checklist" in flag:
         pkgs_for_upgrade = choose_upg(pkgs_for_upgrade)
     return pkgs_for_upgrade
 
 
+def repo_candidates(names):
+    """Return repository packages versions and builds grouped
+    by package name
+    """
+    candidates = {}
+    for name in names:
+        if name:    # this tips because some pkg_name is empty
+            repo_pkg = split_package(name[:-4])
+            if repo_pkg[0]:
+                candidates.setdefault(repo_pkg[0], []).append(
+                    (LooseVersion(repo_pkg[1]), repo_pkg[3]))
+    return candidates
+
+
 def installed():
     """Return all installed packages
     """
@@ -22,40 +22,53 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-import sys
-
-from slpkg.toolbar import status
+from slpkg.resolver import Resolver
 from slpkg.__metadata__ import MetaData as _meta_
 
-from slpkg.binary.greps import Requires
+from slpkg.binary.greps import requires_map
 
 
 class Dependencies(object):
-    """Resolving binary dependencies
+    """Resolving binary dependencies over the repository requirements
+    map
     """
-    def __init__(self, PACKAGES_TXT, repo, black):
-        self.packages = PACKAGES_TXT
+    def __init__(self, repo, black):
         self.repo = repo
         self.black = black
-        self.dep_results = []
         self.meta = _meta_
+        self.adjacency = requires_map(self.repo)
+        self.resolver = Resolver(self._direct)
+        self.cycles = self.resolver.cycles
 
     def binary(self, name, flag):
-        """Build all dependencies of a package
+        """Return all dependencies of a package in installation
+        order, dependencies before the packages that need them
         """
-        if self.meta.rsl_deps in ["on", "ON"] and "--resolve-off" not in flag:
-            sys.setrecursionlimit(10000)
-            dependencies = []
-            requires = Requires(name, self.repo).get_deps()
-            if requires:
-                for req in requires:
-                    status(0)
-                    if req and req not in self.black:
-                        dependencies.append(req)
-                if dependencies:
-                    self.dep_results.append(dependencies)
-                    for dep in dependencies:
-                        self.binary(dep, flag)
-            return self.dep_results
+        if self._enabled(flag):
+            return self.resolver.resolve(name)
         else:
             return []
+
+    def dag(self, names, flag):
+        """Return installation order for all dependencies of names and
+        the dependencies dictionary by package
+        """
+        if self._enabled(flag):
+            return self.resolver.dag(names)
+        return [], dict((name, []) for name in names)
+
+    def _enabled(self, flag):
+        """Return True if dependencies are resolved
+        """
+        return (self.meta.rsl_deps in ["on", "ON"] and
+                "--resolve-off" not in flag)
+
+    def _direct(self, name):
+        """Return package requirements without empty and blacklisted
+        packages
+        """
+        dependencies = []
+        for req in self.adjacency.get(name, []):
+            if req and req not in self.black and req not in dependencies:
+                dependencies.append(req)
+        return dependencies
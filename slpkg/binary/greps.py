@@ -22,30 +22,23 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
-from slpkg.toolbar import status
-from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.slack.slack_version import slack_ver
 
+from slpkg.binary.index import PackagesIndex
 
-def repo_data(PACKAGES_TXT, repo, flag):
+
+def repo_data(data, repo):
     """Grap data packages
     """
     (name, location, size, unsize,
      rname, rlocation, rsize, runsize) = ([] for i in range(8))
-    for line in PACKAGES_TXT.splitlines():
-        if _meta_.rsl_deps in ["on", "ON"] and "--resolve-off" not in flag:
-            status(0.000005)
-        if line.startswith("PACKAGE NAME:"):
-            name.append(line[15:].strip())
-        if line.startswith("PACKAGE LOCATION:"):
-            location.append(line[21:].strip())
-        if line.startswith("PACKAGE SIZE (compressed):"):
-            size.append(line[28:-2].strip())
-        if line.startswith("PACKAGE SIZE (uncompressed):"):
-            unsize.append(line[30:-2].strip())
+    for record in data["records"]:
+        name.append(record["name"])
+        location.append(record["location"])
+        size.append(record["size"])
+        unsize.append(record["unsize"])
     if repo == "rlw":
         (rname,
          rlocation,
@@ -144,6 +137,43 @@ def ktown_filter(name, location, size, unsize):
     return [fname, flocation, fsize, funsize]
 
 
+# requirements maps by repository, kept with the index they built from
+_requires = {}
+
+
+def requires_map(repo):
+    """Return requirements of all packages in repository by name.
+    The map is built once per loaded index and shared by all lookups
+    """
+    if repo == "rlw":
+        # Robby"s repository dependencies as shown in the central page
+        # http://rlworkman.net/pkgs/
+        dependencies = {
+            "abiword": "wv",
+            "claws-mail": "libetpan",
+            "inkscape": "gtkmm atkmm pangomm cairomm mm-common libsigc++ "
+                        "libwpg lxml gsl numpy BeautifulSoup",
+            "texlive": "libsigsegv texi2html",
+            "xfburn": "libburn libisofs"
+        }
+        return dict((name, deps.split())
+                    for name, deps in dependencies.iteritems())
+    data = PackagesIndex(repo).load()
+    cached = _requires.get(repo)
+    if cached and cached[0] is data:
+        return cached[1]
+    fix = Requires(name="", repo=repo)
+    requires = {}
+    for name, indexes in data["by_name"].iteritems():
+        for i in indexes:
+            required = data["records"][i]["required"]
+            if required:
+                requires[name] = fix._req_fix(required)
+                break
+    _requires[repo] = (data, requires)
+    return requires
+
+
 class Requires(object):
 
     def __init__(self, name, repo):
@@ -153,38 +183,14 @@ class Requires(object):
     def get_deps(self):
         """Grap package requirements from repositories
         """
-        if self.repo == "rlw":
-            # Robby"s repository dependencies as shown in the central page
-            # http://rlworkman.net/pkgs/
-            dependencies = {
-                "abiword": "wv",
-                "claws-mail": "libetpan",
-                "inkscape": "gtkmm atkmm pangomm cairomm mm-common libsigc++ "
-                            "libwpg lxml gsl numpy BeautifulSoup",
-                "texlive": "libsigsegv texi2html",
-                "xfburn": "libburn libisofs"
-            }
-            if self.name in dependencies.keys():
-                return dependencies[self.name].split()
-            else:
-                return ""
-        else:
-            PACKAGES_TXT = Utils().read_file("{0}{1}_repo/PACKAGES.TXT".format(
-                _meta_.lib_path, self.repo))
-            for line in PACKAGES_TXT.splitlines():
-                if line.startswith("PACKAGE NAME:"):
-                    pkg_name = split_package(line[14:].strip())[0]
-                if line.startswith("PACKAGE REQUIRED:"):
-                    if pkg_name == self.name:
-                        if line[18:].strip():
-                            return self._req_fix(line)
-
-    def _req_fix(self, line):
+        return requires_map(self.repo).get(self.name, "")
+
+    def _req_fix(self, required):
         """Fix slacky and salix requirements because many dependencies splitting
         with "," and others with "|"
         """
         deps = []
-        for dep in line[18:].strip().split(","):
+        for dep in required.split(","):
             dep = dep.split("|")
             if self.repo == "slacky":
                 if len(dep) > 1:
@@ -0,0 +1,133 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# index.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+
+from slpkg.index import RepoIndex
+from slpkg.splitting import split_package
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+# Slackware lists, the repository index is their union
+SLACK_DIRS = ["core/", "extra/", "pasture/"]
+
+# unions already made by this process
+_unions = {}
+
+
+class PackagesIndex(RepoIndex):
+    """Index of repository PACKAGES.TXT file. Slackware repository has
+    one list in every sub directory and is indexed as their union.
+    """
+    def __init__(self, repo, sub=""):
+        self.repo = repo
+        self.sub = sub
+        self.lib = _meta_.lib_path + "{0}_repo/".format(repo)
+        super(PackagesIndex, self).__init__(self.lib + sub + "PACKAGES.TXT",
+                                            self.lib + sub + "PACKAGES.idx",
+                                            parse_packages)
+
+    def union(self):
+        """Return True if repository is the union of sub directories
+        """
+        return self.repo == "slack" and not self.sub
+
+    def exists(self):
+        """Return True if repository list is downloaded
+        """
+        if self.union():
+            return os.path.isfile(self.lib + SLACK_DIRS[0] + "PACKAGES.TXT")
+        return super(PackagesIndex, self).exists()
+
+    def load(self):
+        """Return indexed data, for Slackware the union of sub
+        directories indexes
+        """
+        if not self.union():
+            return super(PackagesIndex, self).load()
+        parts = [PackagesIndex(self.repo, d) for d in SLACK_DIRS
+                 if os.path.isfile(self.lib + d + "PACKAGES.TXT")]
+        stamps = tuple(part.stamp() for part in parts)
+        cached = _unions.get(self.lib)
+        if cached and cached[0] == stamps:
+            return cached[1]
+        data = merge_indexes([part.load() for part in parts])
+        _unions[self.lib] = (stamps, data)
+        return data
+
+
+def merge_indexes(indexes):
+    """Return one index from PACKAGES.TXT indexes in order
+    """
+    records, names, by_name, updated = [], [], {}, ""
+    for index in indexes:
+        offset = len(records)
+        records += index["records"]
+        names += index["names"]
+        for name, positions in index["by_name"].iteritems():
+            by_name.setdefault(name, []).extend(
+                offset + i for i in positions)
+        updated = updated or index.get("updated", "")
+    return {"records": records, "names": names, "by_name": by_name,
+            "updated": updated}
+
+
+def parse_packages(lines):
+    """Parse PACKAGES.TXT lines and return the records in file order,
+    the package names parallel to the records, the records indexes
+    by package name and the list update date.
+    """
+    records, names, by_name, updated = [], [], {}, ""
+    record = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.startswith("PACKAGES.TXT;"):
+            updated = line[14:].strip()
+        elif line.startswith("PACKAGE NAME:"):
+            record = {
+                "name": line[15:].strip(),
+                "location": "",
+                "size": "",
+                "unsize": "",
+                "required": "",
+                "description": []
+            }
+            name = split_package(record["name"])[0]
+            by_name.setdefault(name, []).append(len(records))
+            records.append(record)
+            names.append(name)
+        elif record is None:
+            continue
+        elif line.startswith("PACKAGE LOCATION:"):
+            record["location"] = line[21:].strip()
+        elif line.startswith("PACKAGE SIZE (compressed):"):
+            record["size"] = line[28:-2].strip()
+        elif line.startswith("PACKAGE SIZE (uncompressed):"):
+            record["unsize"] = line[30:-2].strip()
+        elif line.startswith("PACKAGE REQUIRED:"):
+            record["required"] = line[18:].strip()
+        elif line and not line.startswith("PACKAGE "):
+            record["description"].append(line)
+    return {"records": records, "names": names, "by_name": by_name,
+            "updated": updated}
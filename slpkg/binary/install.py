@@ -22,23 +22,21 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-import os
-
 from slpkg.utils import Utils
 from slpkg.sizes import units
 from slpkg.messages import Msg
-from slpkg.toolbar import status
 from slpkg.checksum import check_md5
 from slpkg.blacklist import BlackList
 from slpkg.downloader import Download
 from slpkg.log_deps import write_deps
 from slpkg.grep_md5 import pkg_checksum
 from slpkg.remove import delete_package
+from slpkg.packages_cache import PackagesCache
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
-from slpkg.pkg.manager import PackageManager
+from slpkg.pkg.transaction import Transaction
 from slpkg.pkg.installed import GetFromInstalled
 
 from slpkg.binary.greps import repo_data
@@ -63,6 +61,7 @@ class BinaryInstall(object):
                 self.tmp_path = fl.split("=")[1]
                 if not self.tmp_path.endswith("/"):
                     self.tmp_path += "/"
+        self.cache = PackagesCache(self.tmp_path)
         self.dwn, self.dep_dwn = [], []
         self.install, self.dep_install = [], []
         self.comp_sum, self.dep_comp_sum = [], []
@@ -71,8 +70,8 @@ class BinaryInstall(object):
         self.deps_dict = {}
         self.answer = ""
         self.msg.reading()
-        self.PACKAGES_TXT, self.mirror = RepoInit(self.repo).fetch()
-        self.data = repo_data(self.PACKAGES_TXT, self.repo, self.flag)
+        self.index, self.mirror = RepoInit(self.repo).fetch()
+        self.data = repo_data(self.index, self.repo)
         self.blacklist = BlackList().packages(self.data[0], self.repo)
 
     def start(self, if_upgrade):
@@ -85,7 +84,6 @@ class BinaryInstall(object):
         mas_sum = dep_sum = sums = [0, 0, 0]
         self.msg.done()
         self.dependencies = self.resolving_deps()
-        self.update_deps()
         (self.dep_dwn, self.dep_install, self.dep_comp_sum,
             self.dep_uncomp_sum) = self.store(self.dependencies)
         self.clear_masters()
@@ -94,6 +92,7 @@ class BinaryInstall(object):
         if (self.meta.rsl_deps in ["on", "ON"] and
                 "--resolve-off" not in self.flag):
             self.msg.done()
+        self.msg.circular(self.resolver.cycles)
         if self.install:
             print("\nThe following packages will be automatically "
                   "installed or upgraded \nwith new version:\n")
@@ -146,24 +145,13 @@ class BinaryInstall(object):
         lowercase
         """
         if "--case-ins" in self.flag:
-            data = []
-            data = Utils().package_name(self.PACKAGES_TXT)
-            data_dict = Utils().case_sensitive(data)
+            data_dict = Utils().case_sensitive(self.index["names"])
             for pkg in self.packages:
                 index = self.packages.index(pkg)
                 for key, value in data_dict.iteritems():
                     if key == pkg.lower():
                         self.packages[index] = value
 
-    def update_deps(self):
-        """Update dependencies dictionary with all package
-        """
-        for dep in self.dependencies:
-            deps = Utils().dimensional_list(Dependencies(
-                self.PACKAGES_TXT, self.repo, self.blacklist).binary(
-                    dep, self.flag))
-            self.deps_dict[dep] = deps
-
     def clear_masters(self):
         """Clear master packages if already exist in dependencies
         or if added to install two or more times
@@ -178,26 +166,28 @@ class BinaryInstall(object):
         """Install or upgrade packages
         """
         installs, upgraded = [], []
+        transaction = Transaction()
         for inst in (self.dep_install + self.install):
-            package = (self.tmp_path + inst).split()
+            package = self.tmp_path + inst
             pkg_ver = "{0}-{1}".format(split_package(inst)[0],
                                        split_package(inst)[1])
             self.checksums(inst)
-            if os.path.isfile(self.meta.pkg_path + inst[:-4]):
+            if transaction.exists(inst):
                 print("[ {0}reinstalling{1} ] --> {2}".format(
                     self.meta.color["GREEN"], self.meta.color["ENDC"], inst))
                 installs.append(pkg_ver)
-                PackageManager(package).upgrade("--reinstall")
-            elif GetFromInstalled(split_package(inst)[0]).name():
+                transaction.add(package, "--reinstall")
+            elif transaction.installed(split_package(inst)[0]):
                 print("[ {0}upgrading{1} ] --> {2}".format(
                     self.meta.color["YELLOW"], self.meta.color["ENDC"], inst))
                 upgraded.append(pkg_ver)
-                PackageManager(package).upgrade("--install-new")
+                transaction.add(package, "--install-new")
             else:
                 print("[ {0}installing{1} ] --> {2}".format(
                     self.meta.color["GREEN"], self.meta.color["ENDC"], inst))
                 installs.append(pkg_ver)
-                PackageManager(package).upgrade("--install-new")
+                transaction.add(package, "--install-new")
+        transaction.commit()
         return [installs, upgraded]
 
     def checksums(self, install):
@@ -208,19 +198,15 @@ class BinaryInstall(object):
     def resolving_deps(self):
         """Return package dependencies
         """
-        requires = []
         if (self.meta.rsl_deps in ["on", "ON"] and
                 self.flag != "--resolve-off"):
             self.msg.resolving()
-        for dep in self.packages:
-            status(0.05)
-            dependencies = []
-            dependencies = Utils().dimensional_list(Dependencies(
-                self.PACKAGES_TXT, self.repo, self.blacklist).binary(
-                    dep, self.flag))
-            requires += dependencies
-            self.deps_dict[dep] = Utils().remove_dbs(dependencies)
-        return Utils().remove_dbs(requires)
+        self.resolver = Dependencies(self.repo, self.blacklist)
+        requires, self.deps_dict = self.resolver.dag(self.packages,
+                                                     self.flag)
+        # store() reverses them back to installation order
+        requires.reverse()
+        return requires
 
     def views(self, install, comp_sum):
         """Views packages
@@ -230,16 +216,17 @@ class BinaryInstall(object):
         repo = self.repo + (" " * (6 - (len(self.repo))))
         for pkg, comp in zip(install, comp_sum):
             pkg_repo = split_package(pkg[:-4])
+            installed = GetFromInstalled(pkg_repo[0])
             if find_package(pkg[:-4], self.meta.pkg_path):
                 pkg_sum += 1
                 COLOR = self.meta.color["GREEN"]
-            elif pkg_repo[0] == GetFromInstalled(pkg_repo[0]).name():
+            elif pkg_repo[0] == installed.name():
                 COLOR = self.meta.color["YELLOW"]
                 upg_sum += 1
             else:
                 COLOR = self.meta.color["RED"]
                 uni_sum += 1
-            ver = GetFromInstalled(pkg_repo[0]).version()
+            ver = installed.version()
             print("  {0}{1}{2}{3} {4}{5} {6}{7}{8}{9}{10}{11:>11}{12}".format(
                 COLOR, pkg_repo[0] + ver, self.meta.color["ENDC"],
                 " " * (23-len(pkg_repo[0] + ver)), pkg_repo[1],
@@ -263,7 +250,8 @@ class BinaryInstall(object):
         self.msg.template(78)
 
     def store(self, packages):
-        """Store and return packages for install
+        """Store and return packages for install, packages verified in
+        cache are not downloaded
         """
         dwn, install, comp_sum, uncomp_sum = ([] for i in range(4))
         # name = data[0]
@@ -276,7 +264,8 @@ class BinaryInstall(object):
                 if (pk and pkg == split_package(pk)[0] and
                         pk not in install and
                         split_package(pk)[0] not in self.blacklist):
-                    dwn.append("{0}{1}/{2}".format(self.mirror, loc, pk))
+                    if not self.cache.cached(pk, self.repo):
+                        dwn.append("{0}{1}/{2}".format(self.mirror, loc, pk))
                     install.append(pk)
                     comp_sum.append(comp)
                     uncomp_sum.append(uncomp)
@@ -286,7 +275,9 @@ class BinaryInstall(object):
                                                  self.data[2], self.data[3]):
                     name = split_package(pk)[0]
                     if (pk and pkg in name and name not in self.blacklist):
-                        dwn.append("{0}{1}/{2}".format(self.mirror, loc, pk))
+                        if not self.cache.cached(pk, self.repo):
+                            dwn.append("{0}{1}/{2}".format(self.mirror, loc,
+                                                           pk))
                         install.append(pk)
                         comp_sum.append(comp)
                         uncomp_sum.append(uncomp)
@@ -22,16 +22,17 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
 from slpkg.repositories import Repo
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.slack.mirrors import mirrors
 from slpkg.slack.slack_version import slack_ver
 
+from slpkg.binary.index import PackagesIndex
+
 
 class RepoInit(object):
-    """Return PACKAGES.TXT and mirror by repository
+    """Return PACKAGES.TXT index and mirror by repository
     """
     def __init__(self, repo):
         self.repo = repo
@@ -44,10 +45,7 @@ class RepoInit(object):
             exec("self._init_{0}()".format(self.repo))
         else:
             exec("self._init_custom()")
-        self.lib = self.meta.lib_path + "{0}_repo/PACKAGES.TXT".format(
-            self.repo)
-        PACKAGES_TXT = Utils().read_file(self.lib)
-        return PACKAGES_TXT, self.mirror
+        return PackagesIndex(self.repo).load(), self.mirror
 
     def _init_custom(self):
         self.mirror = "{0}".format(Repo().custom_repository()[self.repo])
@@ -22,24 +22,17 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
-from slpkg.toolbar import status
 from slpkg.blacklist import BlackList
-from slpkg.splitting import split_package
-from slpkg.__metadata__ import MetaData as _meta_
+
+from slpkg.binary.index import PackagesIndex
 
 
 def search_pkg(name, repo):
     """Search if package exists in PACKAGES.TXT file
     and return the name.
     """
-    PACKAGES_TXT = Utils().read_file(_meta_.lib_path + "{0}_repo/"
-                                     "PACKAGES.TXT".format(repo))
-    names = Utils().package_name(PACKAGES_TXT)
-    blacklist = BlackList().packages(pkgs=names, repo=repo)
-    for line in PACKAGES_TXT.splitlines():
-        status(0)
-        if line.startswith("PACKAGE NAME:  ") and len(line) > 16:
-            pkg_name = split_package(line[15:])[0].strip()
-            if name == pkg_name and name not in blacklist:
-                return pkg_name
+    data = PackagesIndex(repo).load()
+    if name in data["by_name"]:
+        blacklist = BlackList().packages(pkgs=data["names"], repo=repo)
+        if name not in blacklist:
+            return name
@@ -22,6 +22,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
+import os
+from collections import deque
+
 from slpkg.utils import Utils
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
@@ -92,51 +95,162 @@ class BlackList(object):
             print("")   # new line at exit
 
     def packages(self, pkgs, repo):
-        """Return packages in blacklist or by repository
+        """Return packages in blacklist or by repository. The result is
+        cached by blacklist file modification time and the repository
+        package list.
         """
-        self.black = []
-        for bl in self.get_black():
-            pr = bl.split(":")
+        mtime = self.__mtime()
+        pkgs = tuple(pkgs)
+        cached = _results.get((repo, mtime))
+        if cached and cached[0] == pkgs:
+            return cached[1]
+        matcher = _matchers.get((repo, mtime))
+        if matcher is None:
+            matcher = BlackMatcher(self.get_black(), repo)
+            _matchers[(repo, mtime)] = matcher
+        black = set(matcher.exact)
+        if matcher.patterns:
             for pkg in pkgs:
-                self.__priority(pr, repo, pkg)
-                self.__blackpkg(bl, repo, pkg)
-        return self.black
+                if matcher.match(pkg):
+                    black.add(self.__add(repo, pkg))
+        black = frozenset(black)
+        _results[(repo, mtime)] = (pkgs, black)
+        return black
+
+    def __mtime(self):
+        """Return blacklist file modification time
+        """
+        try:
+            return os.path.getmtime(self.blackfile)
+        except OSError:
+            return 0
 
     def __add(self, repo, pkg):
         """Split packages by repository
         """
         if repo == "sbo":
             return pkg
-        else:
-            return split_package(pkg)[0]
+        return split_package(pkg)[0] or pkg
+
+
+# compiled matchers and results by repository and blacklist
+# file modification time
+_matchers = {}
+_results = {}
+
+
+class BlackMatcher(object):
+    """Blacklist compiled for one repository. Names without asterisk
+    are kept in a set, "name*" lines in a prefix trie, "*name" lines
+    in a suffix trie and "*name*" lines in an Aho-Corasick automaton.
+    """
+    def __init__(self, blacklist, repo):
+        self.exact = set()
+        self.match_all = False
+        prefixes, suffixes, substrings = [], [], []
+        for bl in blacklist:
+            bl = bl.strip()
+            if ":" in bl:
+                pr = bl.split(":", 1)
+                if pr[0] != repo:
+                    continue
+                bl = pr[1]
+            if not bl:
+                continue
+            if bl.startswith("*") and bl.endswith("*"):
+                if len(bl) <= 2:
+                    self.match_all = True
+                substrings.append(bl[1:-1])
+            elif bl.endswith("*"):
+                prefixes.append(bl[:-1])
+            elif bl.startswith("*"):
+                suffixes.append(bl[1:])
+            else:
+                self.exact.add(bl)
+        self.patterns = bool(prefixes or suffixes or substrings)
+        self.prefixes = self.__trie(prefixes)
+        self.suffixes = self.__trie([s[::-1] for s in suffixes])
+        self.goto, self.fail, self.out = self.__automaton(substrings)
+
+    def match(self, pkg):
+        """Return True if package matches any pattern
+        """
+        return (self.match_all or
+                self.__trie_match(self.prefixes, pkg) or
+                self.__trie_match(self.suffixes, reversed(pkg)) or
+                self.__automaton_match(pkg))
+
+    def __trie(self, words):
+        """Create trie from words, None key marks word end
+        """
+        root = {}
+        for word in words:
+            node = root
+            for ch in word:
+                node = node.setdefault(ch, {})
+            node[None] = True
+        return root
+
+    def __trie_match(self, root, chars):
+        """Return True if any trie word is a prefix of chars
+        """
+        if not root:
+            return False
+        node = root
+        for ch in chars:
+            if None in node:
+                return True
+            node = node.get(ch)
+            if node is None:
+                return False
+        return None in node
 
-    def __priority(self, pr, repo, pkg):
-        """Add packages in blacklist by priority
+    def __automaton(self, words):
+        """Create Aho-Corasick automaton from words
         """
-        if (pr[0] == repo and pr[1].startswith("*") and
-                pr[1].endswith("*")):
-            if pr[1][1:-1] in pkg:
-                self.black.append(self.__add(repo, pkg))
-        elif pr[0] == repo and pr[1].endswith("*"):
-            if pkg.startswith(pr[1][:-1]):
-                self.black.append(self.__add(repo, pkg))
-        elif pr[0] == repo and pr[1].startswith("*"):
-            if pkg.endswith(pr[1][1:]):
-                self.black.append(self.__add(repo, pkg))
-        elif pr[0] == repo and "*" not in pr[1]:
-            self.black.append(self.__add(repo, pkg))
-
-    def __blackpkg(self, bl, repo, pkg):
-        """Add packages in blacklist
+        goto, out = [{}], [False]
+        for word in words:
+            state = 0
+            for ch in word:
+                if ch not in goto[state]:
+                    goto.append({})
+                    out.append(False)
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            out[state] = True
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].iteritems():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] or out[fail[nxt]]
+        return goto, fail, out
+
+    def __automaton_match(self, text):
+        """Return True if any automaton word is in text
         """
-        if bl.startswith("*") and bl.endswith("*"):
-            if bl[1:-1] in pkg:
-                self.black.append(self.__add(repo, pkg))
-        elif bl.endswith("*"):
-            if pkg.startswith(bl[:-1]):
-                self.black.append(self.__add(repo, pkg))
-        elif bl.startswith("*"):
-            if pkg.endswith(bl[1:]):
-                self.black.append(self.__add(repo, pkg))
-        if bl not in self.black and "*" not in bl:
-            self.black.append(bl)
+        goto, fail, out = self.goto, self.fail, self.out
+        if len(goto) == 1:
+            return False
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+
+def blacklist_mtime():
+    """Return blacklist file modification time
+    """
+    try:
+        return os.path.getmtime(_meta_.conf_path + "blacklist")
+    except OSError:
+        return 0
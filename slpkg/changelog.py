@@ -0,0 +1,186 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# changelog.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import re
+
+from slpkg.fetcher import Fetcher, FetchError
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+# "a/foo-1.0-x86_64-1.txz:  Removed." or "academic/foo: Removed."
+ENTRY = re.compile(r"^(\S+/\S+?):\s+(\w+)")
+
+# Slackware package file extensions
+PACKAGE = re.compile(r"\.t[bglx]z$")
+
+
+class ChangeLogDelta(object):
+    """Update repository lists from the new ChangeLog.txt entries.
+    The new entries are read from the head of the remote ChangeLog
+    with Range requests up to the last stored entry. Removed packages
+    are patched in the local lists and entries of files which are not
+    in the lists are skipped, any other change needs the full lists
+    downloaded again
+    """
+    def __init__(self, log_path, url, lib_path, repo):
+        self.meta = _meta_
+        self.url = url
+        self.log_file = log_path + url.split("/")[-1]
+        self.lib_path = lib_path
+        self.repo = repo
+        self.fetcher = Fetcher(timeout=30)
+        self.text = None
+
+    def fetch(self):
+        """Read the new ChangeLog entries if incremental update is
+        enabled and return them, None if they are not known
+        """
+        if (self.meta.incremental in ["on", "ON"] and
+                self.url.startswith(("http://", "https://"))):
+            self.text = self.read()
+        return self.text
+
+    def read(self):
+        """Return the new ChangeLog entries or None if remote ChangeLog
+        does not contain the local head entry
+        """
+        if not os.path.isfile(self.log_file):
+            return None
+        with open(self.log_file, "r") as f:
+            head = f.readline()
+        if not head.strip():
+            return None
+        size = 65536
+        while size <= 8388608:
+            try:
+                status, data = self.fetcher.read(
+                    self.url, {"Range": "bytes=0-{0}".format(size - 1)})
+            except FetchError:
+                return None
+            if status not in [200, 206]:
+                return None
+            if data.startswith(head):
+                return ""
+            pos = data.find("\n" + head)
+            if pos != -1:
+                return data[:pos + 1]
+            if status == 200 or len(data) < size:
+                return None
+            size *= 4
+        return None
+
+    def entries(self):
+        """Return package path and action of the new entries, entries
+        of binary repositories files other than packages are skipped
+        """
+        entries = []
+        for line in (self.text or "").splitlines():
+            match = ENTRY.match(line)
+            if match and (self.repo == "sbo" or
+                          PACKAGE.search(match.group(1))):
+                entries.append((match.group(1), match.group(2)))
+        return entries
+
+    def patch(self):
+        """Remove packages from local lists and return True if the new
+        entries are removals only
+        """
+        if not self.text:
+            return False
+        entries = self.entries()
+        if [a for p, a in entries if a != "Removed"]:
+            return False
+        lists, checksums = self.lists()
+        if not [f for f in lists if os.path.isfile(f)]:
+            return False
+        removed = set(path.split("/")[-1] for path, action in entries)
+        if not removed:
+            return True
+        for f in lists:
+            self.remove_records(f, removed)
+        for f in checksums:
+            self.remove_checksums(f, removed)
+        return True
+
+    def update_log(self):
+        """Write the new entries at the head of local ChangeLog and
+        return True, or False if they are not known
+        """
+        if not self.text:
+            return False
+        with open(self.log_file, "r") as f:
+            old = f.read()
+        self._write(self.log_file, [self.text, old])
+        return True
+
+    def lists(self):
+        """Return package lists and checksums files of repository
+        """
+        if self.repo == "sbo":
+            return [self.lib_path + "SLACKBUILDS.TXT"], []
+        if self.repo == "slack":
+            dirs = ["core/", "extra/", "pasture/"]
+            return ([self.lib_path + d + "PACKAGES.TXT" for d in dirs],
+                    [self.lib_path + d + "CHECKSUMS.md5" for d in dirs])
+        return ([self.lib_path + "PACKAGES.TXT"],
+                [self.lib_path + "CHECKSUMS.md5"])
+
+    def remove_records(self, path, removed):
+        """Remove records of packages from list. A record starts
+        with its name line and ends before the next one
+        """
+        if not os.path.isfile(path):
+            return
+        lines, keep = [], True
+        with open(path, "r") as f:
+            for line in f:
+                if line.startswith(("PACKAGE NAME:", "SLACKBUILD NAME:")):
+                    keep = line.split(":", 1)[1].strip() not in removed
+                if keep:
+                    lines.append(line)
+        self._write(path, lines)
+
+    def remove_checksums(self, path, removed):
+        """Remove checksums of packages files, signatures and
+        descriptions included
+        """
+        if not os.path.isfile(path):
+            return
+        prefixes = tuple(os.path.splitext(name)[0] + "." for name in removed)
+        lines = []
+        with open(path, "r") as f:
+            for line in f:
+                fields = line.split()
+                if (len(fields) < 2 or
+                        not fields[-1].split("/")[-1].startswith(prefixes)):
+                    lines.append(line)
+        self._write(path, lines)
+
+    def _write(self, path, lines):
+        """Write file through a temporary file
+        """
+        with open(path + ".tmp", "w") as f:
+            f.writelines(lines)
+        os.rename(path + ".tmp", path)
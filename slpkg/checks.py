@@ -25,6 +25,7 @@
 from slpkg.messages import Msg
 from slpkg.arguments import usage
 from slpkg.init import Initialization
+from slpkg.workers import Timeout, number, ordered_map
 from slpkg.__metadata__ import MetaData as _meta_
 
 
@@ -87,22 +88,35 @@ class Updates(object):
         self.summary()
 
     def ALL(self):
-        """Check ALL enabled repositories ChangeLogs
+        """Check ALL enabled repositories ChangeLogs at the same time
+        and print them in order
         """
         self.status_bar()
-        for repo in self.meta.repositories:
-            if repo in self.meta.default_repositories:
-                try:
-                    self.check = self.all_repos[repo]()
-                except OSError:
-                    usage(self.repo)
-                    raise SystemExit()
-            elif repo in self.meta.repositories:
-                self.check = self._init.custom(repo)
+        for repo, check, error in ordered_map(
+                self.check_repo, self.meta.repositories,
+                number(self.meta.update_workers),
+                number(self.meta.update_timeout)):
+            if isinstance(error, OSError):
+                usage(repo)
+                raise SystemExit()
+            self.check = check
+            if isinstance(error, Timeout):
+                self.check = 2
+                self.st = "{0}Timeout{1}".format(self.meta.color["RED"],
+                                                 self.meta.color["ENDC"])
+            elif error:
+                raise error
             self.status()
             self.print_status(repo)
         self.summary()
 
+    def check_repo(self, repo):
+        """Check repository ChangeLog
+        """
+        if repo in self.meta.default_repositories:
+            return getattr(Initialization(True), repo)()
+        return Initialization(True).custom(repo)
+
     def status(self):
         """Set messages
         """
@@ -22,17 +22,22 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.md5sum import md5
+from slpkg.md5sum import md5, md5_verified, md5_keep
 from slpkg.messages import Msg
 from slpkg.__metadata__ import MetaData as _meta_
 
 
 def check_md5(pkg_md5, src_file):
-    """MD5 Checksum
+    """MD5 Checksum, files verified before and not changed are
+    not hashed again
     """
     if _meta_.checkmd5 in ["on", "ON"]:
         print("")
-        md5s = md5(src_file)
+        md5s = md5_verified(src_file)
+        if md5s != pkg_md5:
+            md5s = md5(src_file)
+            if md5s == pkg_md5:
+                md5_keep(src_file, md5s)
         if pkg_md5 != md5s:
             Msg().template(78)
             print("| MD5SUM check for {0} [ {1}FAILED{2} ]".format(
@@ -59,6 +59,20 @@ class Config(object):
             "USE_COLORS",
             "DOWNDER",
             "DOWNDER_OPTIONS",
+            "DOWNLOADS",
+            "HOST_DOWNLOADS",
+            "UPDATE_WORKERS",
+            "BUILD_WORKERS",
+            "PREFETCH",
+            "PREFETCH_SPACE",
+            "SOURCE_CACHE",
+            "SOURCE_CACHE_SIZE",
+            "PACKAGES_CACHE_SIZE",
+            "TRANSACTION",
+            "HEALTH_WORKERS",
+            "UPDATE_TIMEOUT",
+            "INCREMENTAL",
+            "COMPRESSED",
             "SLACKPKG_LOG",
             "ONLY_INSTALLED",
             "PRG_BAR",
@@ -22,12 +22,13 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
 from slpkg.messages import Msg
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.sbo.greps import SBoGrep
 
+from slpkg.binary.index import PackagesIndex
+
 
 class PkgDesc(object):
     """Print package description from the repository
@@ -39,7 +40,6 @@ class PkgDesc(object):
         self.meta = _meta_
         self.msg = Msg()
         self.COLOR = ""
-        self.lib = ""
         color_text = {
             "red": self.meta.color["RED"],
             "green": self.meta.color["GREEN"],
@@ -49,25 +49,23 @@ class PkgDesc(object):
             "": ""
         }
         self.COLOR = color_text[self.paint]
-        if self.repo in self.meta.repositories and self.repo != "sbo":
-            self.lib = self.meta.lib_path + "{0}_repo/PACKAGES.TXT".format(
-                self.repo)
 
     def view(self):
         """Print package description by repository
         """
         print("")   # new line at start
-        description, count = "", 0
+        description = ""
         if self.repo == "sbo":
             description = SBoGrep(self.name).description()
         else:
-            PACKAGES_TXT = Utils().read_file(self.lib)
-            for line in PACKAGES_TXT.splitlines():
-                if line.startswith(self.name + ":"):
-                    description += line[len(self.name) + 2:] + "\n"
-                    count += 1
-                    if count == 11:
-                        break
+            data = PackagesIndex(self.repo).load()
+            for i in data["by_name"].get(self.name, []):
+                lines = [line for line in data["records"][i]["description"]
+                         if line.startswith(self.name + ":")]
+                if lines:
+                    for line in lines[:11]:
+                        description += line[len(self.name) + 2:] + "\n"
+                    break
         if description:
             print("{0}{1}{2}".format(self.COLOR, description,
                                      self.meta.color["ENDC"]))
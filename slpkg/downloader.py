@@ -23,51 +23,189 @@
 
 
 import os
+import threading
 import subprocess
+from urlparse import urlparse
 
 from slpkg.messages import Msg
+from slpkg.workers import number
+from slpkg.fetcher import Fetcher, FetchError
 from slpkg.__metadata__ import MetaData as _meta_
 
 
+class DownloadError(Exception):
+    """Files failed to download with the native downloader. Keeps the
+    FetchError by file name
+    """
+    def __init__(self, errors):
+        Exception.__init__(self, ", ".join(sorted(errors)))
+        self.errors = errors
+
+
 class Download(object):
     """Downloader manager. Slpkg use wget by default but support
-    curl, aria2 and http
+    curl, aria2, http and the native downloader. Files are downloaded
+    in parallel with global and per host limits
     """
-    def __init__(self, path, url, repo):
+    def __init__(self, path, url, repo, quiet=False):
         self.path = path
         self.url = url
         self.repo = repo
+        self.quiet = quiet
         self.file_name = ""
         self.meta = _meta_
         self.msg = Msg()
         self.dir_prefix = ""
         self.downder = self.meta.downder
         self.downder_options = self.meta.downder_options
+        self.downloads = number(self.meta.downloads)
+        self.host_downloads = number(self.meta.host_downloads)
+        self.results = []
+        self.errors = {}
+        self.fetcher = Fetcher()
 
     def start(self):
         """Download files using wget or other downloader.
-        Optional curl, aria2c and hhtp
+        Optional curl, aria2c, hhtp and native. Return list of file
+        names and if downloaded in the order of urls, failures of
+        native downloader are kept in errors by file name and raised
+        with DownloadError. Quiet downloads print nothing and never
+        ask or raise
         """
-        dwn_count = 1
         self._directory_prefix()
+        jobs = []
         for dwn in self.url:
             self.file_name = dwn.split("/")[-1]
-            self._check_certificate()
-            print("\n[{0}/{1}][ {2}Download{3} ] --> {4}\n".format(
-                dwn_count, len(self.url), self.meta.color["GREEN"],
-                self.meta.color["ENDC"],
-                self.file_name))
-            if self.downder in ["wget", "aria2c"]:
-                subprocess.call("{0} {1} {2}{3} {4}".format(
-                                self.downder, self.downder_options,
-                                self.dir_prefix, self.path, dwn),
-                                shell=True)
-            elif self.downder in ["curl", "http"]:
-                subprocess.call("{0} {1} {2}{3} {4}".format(
-                                self.downder, self.downder_options,
-                                self.path, self.file_name, dwn), shell=True)
+            if not self.quiet:
+                self._check_certificate()
+            jobs.append((dwn, self.file_name, self._command(dwn)))
+        self.results = [None] * len(jobs)
+        if self.downloads > 1 and len(jobs) > 1:
+            self._parallel(jobs)
+        else:
+            for count, (dwn, file_name, command) in enumerate(jobs):
+                if self.quiet:
+                    self.results[count] = (file_name, self._run(
+                        dwn, file_name, command, quiet=True))
+                    continue
+                print("\n[{0}/{1}][ {2}Download{3} ] --> {4}\n".format(
+                    count + 1, len(jobs), self.meta.color["GREEN"],
+                    self.meta.color["ENDC"], file_name))
+                self.results[count] = (file_name, self._run(
+                    dwn, file_name, command, quiet=False))
+        if not self.quiet:
             self._check_if_downloaded()
-            dwn_count += 1
+        return self.results
+
+    def _parallel(self, jobs):
+        """Run downloads with workers threads. A worker takes the first
+        pending file which host has not reach the per host limit, files
+        left by a worker stopped with error are failed
+        """
+        pending = list(enumerate(jobs))
+        active = {}
+        done = [0]
+        lock = threading.Condition()
+
+        def worker():
+            while True:
+                with lock:
+                    job = None
+                    while pending:
+                        job = self._next_job(pending, active)
+                        if job:
+                            break
+                        lock.wait()
+                    if job is None:
+                        return
+                    pending.remove(job)
+                    count, (dwn, file_name, command) = job
+                    host = urlparse(dwn).netloc
+                    active[host] = active.get(host, 0) + 1
+                downloaded = False
+                try:
+                    downloaded = self._run(dwn, file_name, command,
+                                           quiet=True)
+                finally:
+                    with lock:
+                        active[host] -= 1
+                        done[0] += 1
+                        self.results[count] = (file_name, downloaded)
+                        if not self.quiet:
+                            self._view(done[0], len(jobs), file_name,
+                                       downloaded)
+                        lock.notify_all()
+
+        if not self.quiet:
+            print("")   # new line at start
+        workers = [threading.Thread(target=worker)
+                   for i in range(min(self.downloads, len(jobs)))]
+        for thread in workers:
+            thread.daemon = True
+            thread.start()
+        for thread in workers:
+            while thread.is_alive():
+                thread.join(0.5)
+        for count, (dwn, file_name, command) in enumerate(jobs):
+            if self.results[count] is None:
+                self.results[count] = (file_name, False)
+
+    def _run(self, dwn, file_name, command, quiet):
+        """Download file and return if downloaded
+        """
+        if self.downder == "native":
+            try:
+                self.fetcher.get(dwn, self.path)
+            except FetchError as e:
+                self.errors[file_name] = e
+                return False
+        elif quiet:
+            with open(os.devnull, "w") as null:
+                subprocess.call(command, shell=True, stdout=null,
+                                stderr=null)
+        else:
+            subprocess.call(command, shell=True)
+        return self._downloaded(file_name)
+
+    def _next_job(self, pending, active):
+        """Return first pending download for a free host
+        """
+        for job in pending:
+            if (active.get(urlparse(job[1][0]).netloc, 0) <
+                    self.host_downloads):
+                return job
+
+    def _view(self, count, total, file_name, downloaded):
+        """Print download result
+        """
+        if downloaded:
+            state = "{0}Done{1}".format(self.meta.color["GREEN"],
+                                        self.meta.color["ENDC"])
+        else:
+            state = "{0}Failed{1}".format(self.meta.color["RED"],
+                                          self.meta.color["ENDC"])
+        print("[{0}/{1}][ {2} ] --> {3}".format(count, total, state,
+                                               file_name))
+
+    def _command(self, dwn):
+        """Return downloader command for url
+        """
+        if self.downder in ["wget", "aria2c"]:
+            return "{0} {1} {2}{3} {4}".format(self.downder,
+                                               self.downder_options,
+                                               self.dir_prefix, self.path,
+                                               dwn)
+        elif self.downder in ["curl", "http"]:
+            return "{0} {1} {2}{3} {4}".format(self.downder,
+                                               self.downder_options,
+                                               self.path,
+                                               dwn.split("/")[-1], dwn)
+        return ""
+
+    def _downloaded(self, file_name):
+        """Check if file downloaded
+        """
+        return os.path.isfile(self.path + file_name)
 
     def _directory_prefix(self):
         """Downloader options for specific directory
@@ -78,16 +216,25 @@ class Download(object):
             self.dir_prefix = "--dir="
 
     def _check_if_downloaded(self):
-        """Check if file downloaded
+        """Report files failed to download, ask to continue if failed
+        with external downloader
         """
-        if not os.path.isfile(self.path + self.file_name):
+        failed = [name for name, downloaded in self.results if not downloaded]
+        if failed:
             print("")
             self.msg.template(78)
-            print("| Download '{0}' file [ {1}FAILED{2} ]".format(
-                self.file_name, self.meta.color["RED"],
-                self.meta.color["ENDC"]))
+            for file_name in failed:
+                print("| Download '{0}' file [ {1}FAILED{2} ]".format(
+                    file_name, self.meta.color["RED"],
+                    self.meta.color["ENDC"]))
+                if file_name in self.errors:
+                    print("| {0}".format(self.errors[file_name].reason))
             self.msg.template(78)
             print("")
+            if self.downder == "native":
+                raise DownloadError(dict((name, self.errors[name])
+                                         for name in failed
+                                         if name in self.errors))
             if not self.msg.answer() in ["y", "Y"]:
                 raise SystemExit()
 
@@ -0,0 +1,310 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# fetcher.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import zlib
+import socket
+import httplib
+import threading
+from urlparse import urlparse, urljoin
+from email.utils import formatdate, parsedate_tz, mktime_tz
+
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+# idle persistent connections by (scheme, host)
+_pool = {}
+_pool_lock = threading.Lock()
+
+
+class FetchError(Exception):
+    """Download failed. Keeps the url, the reason and the HTTP status
+    if the server answered
+    """
+    def __init__(self, url, reason, status=None):
+        Exception.__init__(self, "{0}: {1}".format(url, reason))
+        self.url = url
+        self.reason = reason
+        self.status = status
+
+
+class Fetcher(object):
+    """Native HTTP and HTTPS downloader. Connections are kept alive
+    and reused per mirror, partial files are resumed with Range
+    requests
+    """
+    def __init__(self, timeout=60, redirects=5):
+        self.timeout = timeout
+        self.redirects = redirects
+        self.meta = _meta_
+        self.chunk = 65536
+
+    def get(self, url, path):
+        """Download url in path directory and return the file path.
+        Raise FetchError if failed, a file received short is kept as
+        partial file and resumed by the next download
+        """
+        target = path + url.split("/")[-1]
+        part = target + ".part"
+        for redirect in range(self.redirects + 1):
+            headers = {"User-Agent": "{0}/{1}".format(
+                self.meta.__all__, self.meta.__version__)}
+            offset = 0
+            if os.path.isfile(part):
+                offset = os.path.getsize(part)
+                headers["Range"] = "bytes={0}-".format(offset)
+            elif os.path.isfile(target):
+                headers["If-Modified-Since"] = formatdate(
+                    os.path.getmtime(target), usegmt=True)
+            key, conn, response = self._request("GET", url, headers)
+            if response.status in [301, 302, 303, 307, 308]:
+                location = response.getheader("location")
+                self._release(key, conn, response)
+                if not location:
+                    raise FetchError(url, "redirect without location",
+                                     response.status)
+                url = urljoin(url, location)
+                continue
+            if response.status == 304:
+                self._release(key, conn, response)
+                return target
+            if response.status == 416 and offset:
+                # the partial file is already complete
+                self._release(key, conn, response)
+                os.rename(part, target)
+                return target
+            if response.status not in [200, 206]:
+                self._release(key, conn, response)
+                raise FetchError(url, response.reason, response.status)
+            mode, start, size = "wb", 0, self._length(response)
+            if response.status == 206:
+                mode = "ab"
+                start, size = self._range(response)
+                if start != offset:
+                    conn.close()
+                    os.remove(part)
+                    raise FetchError(url, "unexpected range",
+                                     response.status)
+            try:
+                with open(part, mode) as f:
+                    while True:
+                        data = response.read(self.chunk)
+                        if not data:
+                            break
+                        f.write(data)
+            except (socket.error, httplib.HTTPException) as e:
+                conn.close()
+                raise FetchError(url, str(e) or e.__class__.__name__)
+            except (IOError, OSError) as e:
+                conn.close()
+                raise FetchError(url, e.strerror or str(e))
+            received = os.path.getsize(part)
+            if size is not None and received != size:
+                conn.close()
+                raise FetchError(url, "received {0} of {1} bytes".format(
+                    received, size), response.status)
+            self._release(key, conn, response)
+            os.rename(part, target)
+            self._set_mtime(target, response.getheader("last-modified"))
+            return target
+        raise FetchError(url, "too many redirects")
+
+    def lines(self, url, target, gz=False):
+        """Download url in target file and yield its lines while
+        downloading. Gzip compressed url is decompressed on the way,
+        a body shorter than Content-Length or a compressed stream
+        without its end raise FetchError after the last line
+        """
+        for redirect in range(self.redirects + 1):
+            key, conn, response = self._request("GET", url, {})
+            location = response.getheader("location")
+            if response.status in [301, 302, 303, 307, 308] and location:
+                self._release(key, conn, response)
+                url = urljoin(url, location)
+                continue
+            if response.status != 200:
+                self._release(key, conn, response)
+                raise FetchError(url, response.reason, response.status)
+            gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            rest, received, size = "", 0, self._length(response)
+            end = not gz
+            try:
+                with open(target + ".part", "wb") as f:
+                    while True:
+                        raw = response.read(self.chunk)
+                        received += len(raw)
+                        data = raw
+                        if gz and raw:
+                            data = gunzip.decompress(raw)
+                        elif gz:
+                            end = self._gzip_end(gunzip)
+                            data = gunzip.flush()
+                        if data:
+                            f.write(data)
+                            lines = (rest + data).split("\n")
+                            rest = lines.pop()
+                            for line in lines:
+                                yield line + "\n"
+                        if not raw:
+                            break
+                    if size is not None and received != size:
+                        raise socket.error("received {0} of {1} bytes".format(
+                            received, size))
+                    if not end:
+                        raise zlib.error("compressed stream is truncated")
+            except (socket.error, httplib.HTTPException, zlib.error) as e:
+                conn.close()
+                os.remove(target + ".part")
+                raise FetchError(url, str(e) or e.__class__.__name__)
+            self._release(key, conn, response)
+            os.rename(target + ".part", target)
+            if rest:
+                yield rest
+            return
+        raise FetchError(url, "too many redirects")
+
+    def read(self, url, headers):
+        """Send GET request following redirects and return status
+        and response body
+        """
+        for redirect in range(self.redirects + 1):
+            key, conn, response = self._request("GET", url, headers)
+            location = response.getheader("location")
+            if response.status in [301, 302, 303, 307, 308] and location:
+                self._release(key, conn, response)
+                url = urljoin(url, location)
+                continue
+            try:
+                data = response.read()
+            except (socket.error, httplib.HTTPException) as e:
+                conn.close()
+                raise FetchError(url, str(e) or e.__class__.__name__)
+            self._release(key, conn, response)
+            return response.status, data
+        raise FetchError(url, "too many redirects")
+
+    def head(self, url, headers):
+        """Send HEAD request following redirects and return status
+        and response headers by lower case name
+        """
+        for redirect in range(self.redirects + 1):
+            key, conn, response = self._request("HEAD", url, headers)
+            self._release(key, conn, response)
+            location = response.getheader("location")
+            if response.status in [301, 302, 303, 307, 308] and location:
+                url = urljoin(url, location)
+                continue
+            return response.status, dict(response.getheaders())
+        raise FetchError(url, "too many redirects")
+
+    def _request(self, method, url, headers):
+        """Send request over a pooled connection. A reused connection
+        closed by the server is opened again once
+        """
+        parts = urlparse(url)
+        if parts.scheme not in ["http", "https"]:
+            raise FetchError(url, "unsupported scheme '{0}'".format(
+                parts.scheme))
+        key = (parts.scheme, parts.netloc)
+        selector = parts.path or "/"
+        if parts.query:
+            selector += "?" + parts.query
+        conn, reused = self._connection(key)
+        while True:
+            try:
+                conn.request(method, selector, headers=headers)
+                return key, conn, conn.getresponse()
+            except (socket.error, httplib.HTTPException) as e:
+                conn.close()
+                if not reused:
+                    raise FetchError(url, str(e) or e.__class__.__name__)
+                conn, reused = self._new(key), False
+
+    def _connection(self, key):
+        """Return idle connection for host or a new one
+        """
+        with _pool_lock:
+            if _pool.get(key):
+                return _pool[key].pop(), True
+        return self._new(key), False
+
+    def _new(self, key):
+        """Open new connection
+        """
+        if key[0] == "https":
+            return httplib.HTTPSConnection(key[1], timeout=self.timeout)
+        return httplib.HTTPConnection(key[1], timeout=self.timeout)
+
+    def _release(self, key, conn, response):
+        """Finish response and keep the connection for next requests
+        if server allows
+        """
+        try:
+            response.read()
+        except (socket.error, httplib.HTTPException):
+            conn.close()
+            return
+        if response.will_close:
+            conn.close()
+            return
+        with _pool_lock:
+            _pool.setdefault(key, []).append(conn)
+
+    def _gzip_end(self, gunzip):
+        """Return True if decompressor reached the end of stream,
+        after the end any input is kept in unused_data
+        """
+        if not gunzip.unused_data:
+            gunzip.decompress("\0")
+        return bool(gunzip.unused_data)
+
+    def _length(self, response):
+        """Return response body size or None if not known
+        """
+        length = response.getheader("content-length", "")
+        if length.isdigit():
+            return int(length)
+
+    def _range(self, response):
+        """Return first byte and full file size from Content-Range,
+        size is None if not known
+        """
+        try:
+            first, total = response.getheader("content-range").split(
+                " ")[1].split("/")
+            start, end = [int(i) for i in first.split("-")]
+        except (AttributeError, IndexError, ValueError):
+            return None, None
+        if total.isdigit():
+            return start, int(total)
+        return start, end + 1
+
+    def _set_mtime(self, target, last_modified):
+        """Set file modification time as on server
+        """
+        if last_modified:
+            parsed = parsedate_tz(last_modified)
+            if parsed:
+                mtime = mktime_tz(parsed)
+                os.utime(target, (mtime, mtime))
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# freshness.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import json
+import threading
+from urlparse import urlparse
+
+from slpkg.file_size import FileSize
+from slpkg.fetcher import Fetcher, FetchError
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+# validators seen at checks and waiting the file to be downloaded
+_pending = {}
+_lock = threading.Lock()
+
+
+class Freshness(object):
+    """Check if remote metadata files changed with conditional
+    requests. ETag, Last-Modified and size of every checked file
+    are kept in slpkg lib directory with the local file state they
+    belong to
+    """
+    def __init__(self):
+        self.meta = _meta_
+        self.cache_file = self.meta.lib_path + "validators.json"
+        self.fetcher = Fetcher(timeout=30)
+
+    def changed(self, url, local):
+        """Return True if remote file is not the same as local
+        """
+        if not os.path.isfile(local):
+            return True
+        if urlparse(url).scheme not in ["http", "https"]:
+            return FileSize(url).server() != FileSize(local).local()
+        entry = self._load().get(url)
+        headers = {}
+        if entry and entry["stamp"] == self._stamp(local):
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["modified"]:
+                headers["If-Modified-Since"] = entry["modified"]
+        try:
+            status, info = self.fetcher.head(url, headers)
+        except FetchError:
+            return True
+        if status == 304:
+            return False
+        if status != 200:
+            return True
+        validators = {
+            "etag": info.get("etag"),
+            "modified": info.get("last-modified"),
+            "size": info.get("content-length")
+        }
+        if headers and (validators["etag"] or validators["modified"]):
+            # server ignored conditional headers, compare them here
+            changed = (validators["etag"] != entry["etag"] or
+                       validators["modified"] != entry["modified"])
+        else:
+            changed = validators["size"] != str(os.path.getsize(local))
+        with _lock:
+            if changed:
+                _pending[url] = validators
+            else:
+                self._save(url, validators, local)
+        return changed
+
+    def downloaded(self, url, local):
+        """Keep validators seen at check for the new downloaded file
+        """
+        with _lock:
+            validators = _pending.pop(url, None)
+            if validators and os.path.isfile(local):
+                self._save(url, validators, local)
+
+    def _stamp(self, local):
+        """Return local file size and modification time
+        """
+        st = os.stat(local)
+        return [st.st_size, int(st.st_mtime)]
+
+    def _load(self):
+        """Return stored validators by url
+        """
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def _save(self, url, validators, local):
+        """Store validators of url for local file
+        """
+        entries = self._load()
+        validators["stamp"] = self._stamp(local)
+        entries[url] = validators
+        try:
+            with open(self.cache_file + ".tmp", "w") as f:
+                json.dump(entries, f)
+            os.rename(self.cache_file + ".tmp", self.cache_file)
+        except (IOError, OSError):
+            pass
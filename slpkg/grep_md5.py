@@ -22,28 +22,66 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
+import os
+
 from slpkg.slack.mirrors import mirrors
 
 from slpkg.url_read import URL
 from slpkg.__metadata__ import MetaData as _meta_
 
+from slpkg.binary.index import SLACK_DIRS
+
+
+# CHECKSUMS.md5 indexes by repository and local files state
+_checksums = {}
+
 
 def pkg_checksum(binary, repo):
     """Return checksum from CHECKSUMS.md5 file by repository
     """
-    md5 = "None"
+    return checksums(repo).get(binary, "None")
+
+
+def checksums(repo):
+    """Return checksums of repository by file name. Remote files are
+    fetched and local files read once per session
+    """
+    lib = "{0}{1}_repo/".format(_meta_.lib_path, repo)
     if repo == "slack_patches" and _meta_.slack_rel == "stable":
-        CHECKSUMS_md5 = URL(mirrors("CHECKSUMS.md5", "patches/")).reading()
+        sources = [mirrors("CHECKSUMS.md5", "patches/")]
     elif repo == "slack_patches" and _meta_.slack_rel == "current":
-        CHECKSUMS_md5 = URL(mirrors("CHECKSUMS.md5", "")).reading()
+        sources = [mirrors("CHECKSUMS.md5", "")]
     elif repo == "slpkg":
-        CHECKSUMS_md5 = URL(_meta_.CHECKSUMS_link).reading()
+        sources = [_meta_.CHECKSUMS_link]
+    elif repo == "slack":
+        sources = [lib + d + "CHECKSUMS.md5" for d in SLACK_DIRS]
     else:
-        lib = "{0}{1}_repo/CHECKSUMS.md5".format(_meta_.lib_path, repo)
-        f = open(lib, "r")
-        CHECKSUMS_md5 = f.read()
-        f.close()
-    for line in CHECKSUMS_md5.splitlines():
-        if line.endswith("/{0}".format(binary)):
-            md5 = line.split()[0]
-    return md5
+        sources = [lib + "CHECKSUMS.md5"]
+    key = (repo, tuple(_stamp(source) for source in sources))
+    if key not in _checksums:
+        index = {}
+        for source in sources:
+            for line in _read(source).splitlines():
+                fields = line.split()
+                if len(fields) > 1:
+                    index[fields[-1].split("/")[-1]] = fields[0]
+        _checksums[key] = index
+    return _checksums[key]
+
+
+def _read(source):
+    """Return remote or local file content
+    """
+    if source.startswith(("http://", "https://", "ftp://")):
+        return URL(source).reading()
+    if os.path.isfile(source):
+        with open(source, "r") as f:
+            return f.read()
+    return ""
+
+
+def _stamp(source):
+    """Return modification time of local file
+    """
+    if os.path.isfile(source):
+        return os.path.getmtime(source)
@@ -23,8 +23,10 @@
 
 
 import os
+import json
 
 from slpkg.messages import Msg
+from slpkg.workers import number, ordered_map
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
@@ -33,11 +35,13 @@ from slpkg.pkg.find import find_package
 class PackageHealth(object):
     """Health check installed packages
     """
-    def __init__(self, mode):
+    def __init__(self, mode, incremental=False):
         self.mode = mode
+        self.incremental = incremental
         self.meta = _meta_
         self.msg = Msg()
         self.pkg_path = _meta_.pkg_path
+        self.report = _meta_.lib_path + "health.json"
         self.installed = []
         self.cn = 0
 
@@ -46,41 +50,120 @@ class PackageHealth(object):
         """
         self.installed = find_package("", self.pkg_path)
 
-    def check(self, line, pkg):
-        line = line.replace("\n", "")
+    def check(self, line, pkg, exists):
+        """Print file status, files not installed are counted
+        """
         try:
-            if (not line.endswith("/") and
-                    not line.endswith(".new") and
-                    not line.startswith("dev/") and
-                    not line.startswith("install/") and
-                    "/incoming/" not in line):
-                if not os.path.isfile("/" + line):
-                    self.cn += 1
-                    print("Not installed: {0}/{1}{2} --> {3}".format(
-                        self.meta.color["RED"], line, self.meta.color["ENDC"],
-                        pkg))
-                elif not self.mode:
-                    print(line)
+            if line not in exists:
+                self.cn += 1
+                print("Not installed: {0}/{1}{2} --> {3}".format(
+                    self.meta.color["RED"], line, self.meta.color["ENDC"],
+                    pkg))
+            elif not self.mode:
+                print(line)
         except IOError:
             print("")
             raise SystemExit()
 
     def test(self):
-        """Get started test each package and read file list
+        """Get started test each package and read file list. Files are
+        checked by listing each directory once with worker threads, the
+        incremental test verifies again only packages which file list
+        changed since the last report and the files were not installed
         """
         self.packages()
         self.cf = 0
+        previous = self._load() if self.incremental else {}
+        report, files = {}, {}
         for pkg in self.installed:
             if os.path.isfile(self.meta.pkg_path + pkg):
-                self.lf = 0
-                with open(self.pkg_path + pkg, "r") as fopen:
-                    for line in fopen:
-                        self.cf += 1     # count all files
-                        self.lf += 1     # count each package files
-                        if self.lf > 19:
-                            self.check(line, pkg)
+                mtime = os.path.getmtime(self.pkg_path + pkg)
+                if pkg in previous and previous[pkg][0] == mtime:
+                    report[pkg] = previous[pkg]
+                else:
+                    files[pkg] = (mtime,) + self._files(pkg)
+        exists = self._exists([entry[2] for entry in
+                               files.values() + report.values()])
+        for pkg in self.installed:
+            if pkg in files:
+                mtime, count, lines = files[pkg]
+            elif pkg in report:
+                mtime, count, lines = report[pkg]
+            else:
+                continue
+            for line in lines:
+                self.check(line, pkg, exists)
+            report[pkg] = [mtime, count,
+                           [line for line in lines if line not in exists]]
+            self.cf += count     # count all files
+        self._save(report)
         self.results()
 
+    def _files(self, pkg):
+        """Return number of lines and files to check from package
+        file list
+        """
+        count, lines = 0, []
+        with open(self.pkg_path + pkg, "r") as fopen:
+            for line in fopen:
+                count += 1
+                line = line.replace("\n", "")
+                if (count > 19 and
+                        not line.endswith("/") and
+                        not line.endswith(".new") and
+                        not line.startswith("dev/") and
+                        not line.startswith("install/") and
+                        "/incoming/" not in line):
+                    lines.append(line)
+        return count, lines
+
+    def _exists(self, files):
+        """Return files exist from lists of files, directories are
+        checked in parallel
+        """
+        directories = {}
+        for lines in files:
+            for line in lines:
+                path, name = os.path.split("/" + line)
+                directories.setdefault(path, []).append((name, line))
+        exists = set()
+        for path, found, error in ordered_map(
+                lambda path: self._found(path, directories[path]),
+                directories, number(self.meta.health_workers)):
+            exists.update(found or [])
+        return exists
+
+    def _found(self, path, names):
+        """Return files of (name, line) names found in directory
+        listing. Directories are not in packages files to check, a
+        broken symbolic link is found as installed
+        """
+        try:
+            listing = set(os.listdir(path))
+        except OSError:
+            return []
+        return [line for name, line in names if name in listing]
+
+    def _load(self):
+        """Return last report by package
+        """
+        try:
+            with open(self.report, "r") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def _save(self, report):
+        """Save package modification time, files number and files not
+        installed by package
+        """
+        try:
+            with open(self.report + ".tmp", "w") as f:
+                json.dump(report, f)
+            os.rename(self.report + ".tmp", self.report)
+        except (IOError, OSError):
+            pass
+
     def results(self):
         """Print results
         """
@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# index.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+# indexes already loaded by this process
+_loaded = {}
+
+
+class RepoIndex(object):
+    """Persistent index of a repository list file. The parsed data is
+    stored with pickle next to the list and rebuilt only when the size
+    or the modification time of the list change. Parse is called with
+    the list file lines and returns the indexed data.
+    """
+    def __init__(self, source, index_file, parse):
+        self.source = source
+        self.index_file = index_file
+        self.parse = parse
+
+    def exists(self):
+        """Return True if list file exists
+        """
+        return os.path.isfile(self.source)
+
+    def stamp(self):
+        """Return size and modification time of the list file
+        """
+        st = os.stat(self.source)
+        return (st.st_size, st.st_mtime)
+
+    def load(self):
+        """Return indexed data, rebuild index if list file changed
+        """
+        stamp = self.stamp()
+        cached = _loaded.get(self.index_file)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(self.index_file, "rb") as f:
+                saved, data = pickle.load(f)
+            if saved == stamp:
+                _loaded[self.index_file] = (stamp, data)
+                return data
+        except (IOError, OSError, EOFError, ValueError, TypeError,
+                pickle.UnpicklingError):
+            pass
+        return self.build()
+
+    def build(self):
+        """Parse list file and write the index
+        """
+        stamp = self.stamp()
+        with open(self.source, "r") as f:
+            return self.build_from(f, stamp)
+
+    def build_from(self, lines, stamp=None):
+        """Parse lines and write the index. Lines may be read while
+        the list file is written, it must be complete when they end
+        """
+        data = self.parse(lines)
+        if stamp is None:
+            stamp = self.stamp()
+        self.write(stamp, data)
+        _loaded[self.index_file] = (stamp, data)
+        return data
+
+    def write(self, stamp, data):
+        """Write index file, skip silently if the library path
+        is not writable (no root user)
+        """
+        tmp = self.index_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((stamp, data), f, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, self.index_file)
+        except (IOError, OSError):
+            pass
@@ -27,20 +27,32 @@ import sys
 import shutil
 
 from slpkg.repositories import Repo
-from slpkg.file_size import FileSize
+from slpkg.workers import Timeout, number, ordered_map
 from slpkg.downloader import Download
+from slpkg.fetcher import Fetcher, FetchError
+from slpkg.freshness import Freshness
+from slpkg.changelog import ChangeLogDelta
 from slpkg.__metadata__ import MetaData as _meta_
 
+from slpkg.sbo.index import SBoIndex
+
+from slpkg.binary.index import PackagesIndex
+
 from slpkg.slack.mirrors import mirrors
 from slpkg.slack.slack_version import slack_ver
 
 
 class Initialization(object):
     """Slpkg initialization start all from here. Create local
-    package lists and update or upgrade these.
+    package lists and update or upgrade these. Files are downloaded
+    in .update/ directory and moved in place when a step finished,
+    lists come first and ChangeLog.txt last
     """
     def __init__(self, check):
         self.check = check
+        self.quiet = False
+        self.failed = []
+        self.staged = []
         self.meta = _meta_
         self.def_repos_dict = Repo().default_repository()
         self.conf_path = self.meta.conf_path
@@ -130,12 +142,11 @@ class Initialization(object):
         self.down(log, ChangeLog_txt, repo_name)
         self.remote(log, ChangeLog_txt, lib, PACKAGES_TXT, CHECKSUMS_MD5,
                     FILELIST_TXT, repo_name)
-        self.merge(lib, "PACKAGES.TXT", ["core/PACKAGES.TXT",
-                                         "extra/PACKAGES.TXT",
-                                         "pasture/PACKAGES.TXT"])
-        self.merge(lib, "CHECKSUMS.md5", ["core/CHECKSUMS.md5",
-                                          "extra/CHECKSUMS.md5",
-                                          "pasture/CHECKSUMS.md5"])
+        # lists are not merged any more, index is the union of them
+        self.file_remove(lib, "PACKAGES.TXT")
+        self.file_remove(lib, "CHECKSUMS.md5")
+        self.file_remove(lib, "PACKAGES.idx")
+        self.index(repo_name)
 
     def sbo(self):
         """Creating sbo local library
@@ -569,15 +580,82 @@ class Initialization(object):
         self.remote(log, ChangeLog_txt, lib, PACKAGES_TXT, CHECKSUMS_MD5,
                     FILELIST_TXT, repo_name)
 
-    def down(self, path, link, repo):
-        """Download files
+    def down(self, path, link, repo, renew=False):
+        """Download file in the update directory of path and keep the
+        names of files failed. File exists is downloaded only if renew
+        """
+        filename = link.split("/")[-1]
+        if not filename or (os.path.isfile(path + filename) and not renew):
+            return
+        stage = path + ".update/"
+        if not os.path.exists(stage):
+            os.mkdir(stage)
+        self.file_remove(stage, filename)
+        if not self.down_stream(stage, link, repo, path):
+            for name, downloaded in Download(stage, link.split(), repo,
+                                             quiet=self.quiet).start():
+                if not downloaded:
+                    self.failed.append(name)
+        self.staged.append((stage, filename, path))
+
+    def finish(self):
+        """Move downloaded files in place, old files of the downloads
+        failed are kept
+        """
+        for stage, filename, path in self.staged:
+            if os.path.isfile(stage + filename):
+                os.rename(stage + filename, path + filename)
+            try:
+                os.rmdir(stage)
+            except OSError:
+                pass
+        self.staged = []
+
+    def down_stream(self, stage, link, repo, path):
+        """Download packages lists and parse them into their index
+        while downloading, gzip compressed lists are preferred if
+        mirror has them. Checksums are streamed only compressed, else
+        left to the downloader. Return True if downloaded
         """
         filename = link.split("/")[-1]
-        if not os.path.isfile(path + filename):
-            Download(path, link.split(), repo).start()
+        if (filename not in ["PACKAGES.TXT", "CHECKSUMS.md5",
+                             "SLACKBUILDS.TXT"] or
+                not link.startswith(("http://", "https://"))):
+            return False
+        urls = []
+        if self.meta.compressed in ["on", "ON"]:
+            urls.append(link + ".gz")
+        if filename != "CHECKSUMS.md5":
+            urls.append(link)
+        for url in urls:
+            try:
+                lines = Fetcher().lines(url, stage + filename,
+                                        gz=url.endswith(".gz"))
+                if filename == "CHECKSUMS.md5":
+                    for line in lines:
+                        pass
+                else:
+                    if filename == "SLACKBUILDS.TXT":
+                        index = SBoIndex()
+                    else:
+                        index = PackagesIndex(repo, path[len(
+                            self.lib_path + repo + "_repo/"):])
+                    # stamp of the new list, kept when moved in place
+                    index.source = stage + filename
+                    index.build_from(lines)
+            except FetchError:
+                continue
+            if not self.quiet:
+                print("\n[ {0}Download{1} ] --> {2}\n".format(
+                    self.meta.color["GREEN"], self.meta.color["ENDC"],
+                    url.split("/")[-1]))
+            return True
+        return False
 
     def remote(self, *args):
-        """Remove and recreate files
+        """Download again files if ChangeLog.txt changed and the new
+        entries can not patch the lists. ChangeLog.txt is replaced after
+        the lists only if all of them downloaded
         """
         log_path = args[0]
         ChangeLog_txt = args[1]
@@ -587,40 +665,45 @@ class Initialization(object):
         FILELIST_TXT = args[5]
         repo = args[6]
 
+        self.finish()
         if self.checks_logs(log_path, ChangeLog_txt):
-            # remove old files
-            self.file_remove(log_path, ChangeLog_txt.split("/")[-1])
-            self.file_remove(lib_path, PACKAGES_TXT.split("/")[-1])
-            self.file_remove(lib_path, CHECKSUMS_MD5.split("/")[-1])
-            self.file_remove(lib_path, FILELIST_TXT.split("/")[-1])
-            if repo == "slack":
-                dirs = ["core/", "extra/", "pasture/"]
-                for d in dirs:
-                    self.file_remove(lib_path + d, "PACKAGES.TXT")
-                    self.file_remove(lib_path + d, "CHECKSUMS.md5")
-                self.down(lib_path + "core/", PACKAGES_TXT, repo)
-                self.down(lib_path + "core/", CHECKSUMS_MD5, repo)
-                self.down(lib_path + "extra/", self.EXTRA, repo)
-                self.down(lib_path + "extra/", self.EXT_CHECKSUMS, repo)
-                if slack_ver() != "14.0":  # no pasture/ folder for 14.0 version
-                    self.down(lib_path + "pasture/", self.PASTURE, repo)
-                    self.down(lib_path + "pasture/", self.PAS_CHECKSUMS, repo)
-            # download new files
-            if repo != "slack":
-                self.down(lib_path, PACKAGES_TXT, repo)
-                self.down(lib_path, CHECKSUMS_MD5, repo)
-            self.down(lib_path, FILELIST_TXT, repo)
-            self.down(log_path, ChangeLog_txt, repo)
-
-    def merge(self, path, outfile, infiles):
-        """Merge files
+            delta = ChangeLogDelta(log_path, ChangeLog_txt, lib_path, repo)
+            delta.fetch()
+            if not delta.patch():
+                if repo == "slack":
+                    self.down(lib_path + "core/", PACKAGES_TXT, repo, True)
+                    self.down(lib_path + "core/", CHECKSUMS_MD5, repo, True)
+                    self.down(lib_path + "extra/", self.EXTRA, repo, True)
+                    self.down(lib_path + "extra/", self.EXT_CHECKSUMS, repo,
+                              True)
+                    # no pasture/ folder for 14.0 version
+                    if slack_ver() != "14.0":
+                        self.down(lib_path + "pasture/", self.PASTURE, repo,
+                                  True)
+                        self.down(lib_path + "pasture/", self.PAS_CHECKSUMS,
+                                  repo, True)
+                else:
+                    self.down(lib_path, PACKAGES_TXT, repo, True)
+                    self.down(lib_path, CHECKSUMS_MD5, repo, True)
+                self.down(lib_path, FILELIST_TXT, repo, True)
+                self.finish()
+            if not self.failed:
+                if not delta.update_log():
+                    self.down(log_path, ChangeLog_txt, repo, True)
+                    self.finish()
+                Freshness().downloaded(ChangeLog_txt, log_path +
+                                       ChangeLog_txt.split("/")[-1])
+        if repo != "slack":
+            self.index(repo)
+
+    def index(self, repo):
+        """Rebuild repository index if package list changed
         """
-        with open(path + outfile, 'w') as out_f:
-            for i in infiles:
-                if os.path.isfile("{0}{1}".format(path, i)):
-                    with open(path + i, "r") as in_f:
-                        for line in in_f:
-                            out_f.write(line)
+        if repo == "sbo":
+            if SBoIndex().exists():
+                SBoIndex().load()
+        elif PackagesIndex(repo).exists():
+            PackagesIndex(repo).load()
 
     def file_remove(self, path, filename):
         """Check if filename exists and remove
@@ -631,14 +714,7 @@ class Initialization(object):
     def checks_logs(self, log_path, url):
         """Checks ChangeLog.txt for changes
         """
-        local = ""
-        filename = url.split("/")[-1]
-        server = FileSize(url).server()
-        if os.path.isfile(log_path + filename):
-            local = FileSize(log_path + filename).local()
-        if server != local:
-            return True
-        return False
+        return Freshness().changed(url, log_path + url.split("/")[-1])
 
     def upgrade(self, only):
         """Remove all package lists with changelog and checksums files
@@ -665,52 +741,68 @@ class Initialization(object):
 class Update(object):
 
     def __init__(self):
-        self._init = "Initialization(False)"
         self.meta = _meta_
         self.done = "{0}Done{1}\n".format(self.meta.color["GREY"],
                                           self.meta.color["ENDC"])
         self.error = "{0}Error{1}\n".format(self.meta.color["RED"],
                                             self.meta.color["ENDC"])
+        self.timeout = "{0}Timeout{1}\n".format(self.meta.color["RED"],
+                                                self.meta.color["ENDC"])
+        self.workers = number(self.meta.update_workers)
 
     def repository(self, only):
-        """Update repositories lists
+        """Update repositories lists. Repositories are updated at the
+        same time and printed in order
         """
         print("\nCheck and update repositories:\n")
-        default = self.meta.default_repositories
         enabled = self.meta.repositories
         if only:
             enabled = only
-        for repo in enabled:
+        Initialization(False)   # create directories before workers
+        for repo, result, error in ordered_map(
+                self.update, enabled, self.workers,
+                number(self.meta.update_timeout)):
             sys.stdout.write("{0}Check repository [{1}{2}{3}] ... "
                              "{4}".format(
                                     self.meta.color["GREY"],
                                     self.meta.color["CYAN"], repo,
                                     self.meta.color["GREY"],
                                     self.meta.color["ENDC"]))
-            sys.stdout.flush()
-            if repo in default:
-                exec("{0}.{1}()".format(self._init, repo))
-                sys.stdout.write(self.done)
-            elif repo in enabled:
-                Initialization(False).custom(repo)
-                sys.stdout.write(self.done)
-            else:
+            if isinstance(error, Timeout):
+                sys.stdout.write(self.timeout)
+            elif error or not result:
                 sys.stdout.write(self.error)
+            else:
+                sys.stdout.write(self.done)
+            sys.stdout.flush()
         print("")   # new line at end
         raise SystemExit()
 
+    def update(self, repo):
+        """Update repository list and return False if repository
+        is unknown or lists failed to download
+        """
+        init = Initialization(False)
+        init.quiet = self.workers > 1
+        if repo in self.meta.default_repositories:
+            getattr(init, repo)()
+        elif repo in self.meta.repositories:
+            init.custom(repo)
+        else:
+            return False
+        return not init.failed
+
 
 def check_exists_repositories():
     """Checking if repositories exists by PACKAGES.TXT file
     """
     update = False
-    pkg_list = "PACKAGES.TXT"
     for repo in _meta_.repositories:
-        pkg_list = "PACKAGES.TXT"
         if repo == "sbo":
-            pkg_list = "SLACKBUILDS.TXT"
-        if not os.path.isfile("{0}{1}{2}".format(_meta_.lib_path, repo,
-                                                 "_repo/{0}".format(pkg_list))):
+            exists = SBoIndex().exists()
+        else:
+            exists = PackagesIndex(repo).exists()
+        if not exists:
             update = True
     if update:
         print("\n  Please update packages lists. Run 'slpkg update'.\n" +
@@ -22,36 +22,27 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-import os
-
-from slpkg.utils import Utils
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
 
+from slpkg.sbo.index import SBoIndex
+
+from slpkg.binary.index import PackagesIndex
+
 
 def library(repo):
     """Load packages from slpkg library and from local
     """
-    pkg_list, packages = [], ""
+    pkg_list = []
     if repo == "sbo":
-        if (os.path.isfile(
-                _meta_.lib_path + "{0}_repo/SLACKBUILDS.TXT".format(repo))):
-            packages = Utils().read_file(_meta_.lib_path + "{0}_repo/"
-                                         "SLACKBUILDS.TXT".format(repo))
-    else:
-        if (os.path.isfile(
-                _meta_.lib_path + "{0}_repo/PACKAGES.TXT".format(repo))):
-            packages = Utils().read_file(_meta_.lib_path + "{0}_repo/"
-                                         "PACKAGES.TXT".format(repo))
-    for line in packages.splitlines():
-        if repo == "sbo":
-            if line.startswith("SLACKBUILD NAME: "):
-                pkg_list.append(line[17:].strip())
-        elif "local" not in repo:
-            if line.startswith("PACKAGE NAME: "):
-                pkg_list.append(line[15:].strip())
+        if SBoIndex().exists():
+            pkg_list = list(SBoIndex().load()["names"])
+    elif "local" not in repo:
+        if PackagesIndex(repo).exists():
+            pkg_list = [record["name"] for record in
+                        PackagesIndex(repo).load()["records"]]
     if repo == "local":
         pkg_list = find_package("", _meta_.pkg_path)
     return pkg_list
@@ -23,16 +23,25 @@
 
 
 import os
+import json
 
+from slpkg.blacklist import blacklist_mtime
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
 
 
+# packages by dependency from dependencies logs
+_index = {}
+
+
 def write_deps(deps_dict):
     """Write dependencies in a log file
     into directory `/var/log/slpkg/dep/`
     """
+    # index is read before logs change
+    dependents()
+    logs = {}
     for name, dependencies in deps_dict.iteritems():
         if find_package(name + _meta_.sp, _meta_.pkg_path):
             dep_path = _meta_.log_path + "dep/"
@@ -45,3 +54,113 @@ def write_deps(deps_dict):
                     for dep in dependencies:
                         f.write(dep + "\n")
                     f.close()
+            logs[name] = dependencies
+    if logs:
+        _update(logs)
+
+
+def remove_deps(name):
+    """Remove dependencies log file of package
+    """
+    dep_path = _meta_.log_path + "dep/"
+    if os.path.isfile(dep_path + name):
+        dependents()
+        os.remove(dep_path + name)
+        _update({name: []})
+
+
+def dependents():
+    """Return packages which dependencies logs list each dependency.
+    Index is kept in dependents.json and built again from the logs
+    only if logs or blacklist changed out of slpkg, they are checked
+    once per session
+    """
+    if "stamp" not in _index:
+        stamp = _stamp()
+        index = _load()
+        if index.get("stamp") != stamp:
+            index = {"stamp": stamp, "dependents": _build()}
+            _save(index)
+        _index.update(index)
+    return _index["dependents"]
+
+
+def _update(logs):
+    """Update index read before the logs changed with the new
+    dependencies logs by package. Stamp is updated from the logs
+    written only
+    """
+    index, stamp = _index["dependents"], _index["stamp"]
+    for dep, packages in index.items():
+        packages = [pkg for pkg in packages if pkg not in logs]
+        if packages:
+            index[dep] = packages
+        else:
+            del index[dep]
+    for name, dependencies in logs.iteritems():
+        for dep in set(dependencies):
+            index[dep] = sorted(index.get(dep, []) + [name])
+    dep_path = _meta_.log_path + "dep/"
+    mtimes = [stamp[2]] + [os.path.getmtime(dep_path + name)
+                           for name in logs
+                           if os.path.isfile(dep_path + name)]
+    _index["stamp"] = [_dir_mtime(), stamp[1], max(mtimes)]
+    _save(_index)
+
+
+def _build():
+    """Return index from dependencies logs
+    """
+    index = {}
+    dep_path = _meta_.log_path + "dep/"
+    for log in find_package("", dep_path):
+        with open(dep_path + log, "r") as f:
+            for dep in set(f.read().splitlines()):
+                index.setdefault(dep, []).append(log)
+    return index
+
+
+def _stamp():
+    """Return modification times of dependencies logs directory,
+    blacklist file and the last modified log
+    """
+    dep_path = _meta_.log_path + "dep/"
+    logs = [0]
+    if os.path.isdir(dep_path):
+        for log in os.listdir(dep_path):
+            try:
+                logs.append(os.stat(dep_path + log).st_mtime)
+            except OSError:
+                pass
+    return [_dir_mtime(), blacklist_mtime(), max(logs)]
+
+
+def _dir_mtime():
+    """Return dependencies logs directory modification time
+    """
+    dep_path = _meta_.log_path + "dep/"
+    if os.path.isdir(dep_path):
+        return os.stat(dep_path).st_mtime
+    return 0
+
+
+def _load():
+    """Return saved index
+    """
+    try:
+        with open(_meta_.lib_path + "dependents.json", "r") as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save(index):
+    """Save index
+    """
+    index_file = _meta_.lib_path + "dependents.json"
+    try:
+        with open(index_file + ".tmp", "w") as f:
+            json.dump(index, f)
+        os.rename(index_file + ".tmp", index_file)
+    except (IOError, OSError):
+        pass
@@ -35,6 +35,7 @@ from slpkg.repoinfo import RepoInfo
 from slpkg.repolist import RepoList
 from slpkg.repositories import Repo
 from slpkg.blacklist import BlackList
+from slpkg.downloader import DownloadError
 from slpkg.version import prog_version
 from slpkg.health import PackageHealth
 from slpkg.new_config import NewConfig
@@ -188,11 +189,15 @@ class ArgParse(object):
     def command_health(self):
         """Check package health
         """
-        if len(self.args) == 1 and self.args[0] == "health":
-            PackageHealth(mode="").test()
-        elif (len(self.args) == 2 and self.args[0] == "health" and
-                self.args[1] == "--silent"):
-            PackageHealth(mode=self.args[1]).test()
+        options = ["--silent", "--incremental"]
+        if (self.args and self.args[0] == "health" and
+                len(set(self.args[1:])) == len(self.args[1:]) and
+                set(self.args[1:]).issubset(options)):
+            mode = ""
+            if "--silent" in self.args:
+                mode = "--silent"
+            PackageHealth(mode=mode,
+                          incremental="--incremental" in self.args).test()
         else:
             usage("")
 
@@ -759,6 +764,8 @@ def main():
         arguments[args[0]]()
     except KeyError:
         usage("")
+    except DownloadError:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
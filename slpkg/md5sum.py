@@ -22,12 +22,87 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
+import os
+import json
+import atexit
 import hashlib
+import threading
+
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+_lock = threading.Lock()
+
+# verified checksums by path, read once and saved at exit if changed
+_verified = {}
 
 
 def md5(source):
-    """Return MD5 Checksum
+    """Return MD5 Checksum, file is read in chunks
+    """
+    checksum = hashlib.md5()
+    with open(source, "rb") as file_to_check:
+        for data in iter(lambda: file_to_check.read(1048576), b""):
+            checksum.update(data)
+    return checksum.hexdigest()
+
+
+def md5_verified(source):
+    """Return MD5 Checksum verified before if file did not change,
+    file state is its path, size, modification time and inode
+    """
+    path, state = _state(source)
+    with _lock:
+        entry = _checksums().get(path)
+    if entry and entry[0] == state:
+        return entry[1]
+
+
+def md5_keep(source, checksum):
+    """Keep verified MD5 Checksum of file, checksums are saved once
+    at exit
+    """
+    path, state = _state(source)
+    with _lock:
+        if not _verified.get("changed"):
+            atexit.register(_save)
+        _checksums()[path] = [state, checksum]
+        _verified["changed"] = True
+
+
+def _state(source):
+    """Return absolute path and state of file
+    """
+    st = os.stat(source)
+    return (os.path.abspath(source),
+            [st.st_size, st.st_mtime, st.st_ino])
+
+
+def _checksums():
+    """Return verified checksums by path, files do not exist any more
+    are removed when loaded
+    """
+    if "checksums" not in _verified:
+        try:
+            with open(_meta_.lib_path + "md5sums.json", "r") as f:
+                checksums = json.load(f)
+        except (IOError, ValueError):
+            checksums = {}
+        _verified["checksums"] = dict((p, e) for p, e in
+                                      checksums.iteritems()
+                                      if os.path.isfile(p))
+    return _verified["checksums"]
+
+
+def _save():
+    """Save verified checksums
     """
-    with open(source) as file_to_check:
-        data = file_to_check.read()
-        return hashlib.md5(data).hexdigest()
+    cache_file = _meta_.lib_path + "md5sums.json"
+    with _lock:
+        try:
+            with open(cache_file + ".tmp", "w") as f:
+                json.dump(_checksums(), f)
+            os.rename(cache_file + ".tmp", cache_file)
+        except (IOError, OSError):
+            pass
+        _verified["changed"] = False
@@ -62,6 +62,15 @@ class Msg(object):
         self.template(78)
         print("")   # new line at end
 
+    def circular(self, cycles):
+        """Print circular dependencies skipped from resolving
+        """
+        for pkg, dep in cycles:
+            self.template(78)
+            print("| Circular dependency {0} --> {1} [ {2}SKIPPED{3} ]".format(
+                pkg, dep, self.meta.color["YELLOW"], self.meta.color["ENDC"]))
+            self.template(78)
+
     def template(self, max_len):
         """Print template
         """
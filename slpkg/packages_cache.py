@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# packages_cache.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import time
+
+from slpkg.grep_md5 import pkg_checksum
+from slpkg.md5sum import md5, md5_verified, md5_keep
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+class PackagesCache(object):
+    """Downloaded binary packages kept in packages path. Packages which
+    match CHECKSUMS.md5 are not downloaded again, the least recently
+    used are removed when the cache is bigger than PACKAGES_CACHE_SIZE
+    MB. Last use is kept in access time, modification time is part of
+    the verified md5sum state
+    """
+    def __init__(self, path):
+        self.path = path
+        self.meta = _meta_
+        try:
+            self.size = int(self.meta.packages_cache_size) * 1024 * 1024
+        except ValueError:
+            self.size = 0
+
+    def cached(self, package, repo):
+        """Return True if package is in cache and match its checksum.
+        Broken packages are removed, packages without checksum are not
+        cached but kept
+        """
+        source = self.path + package
+        if not os.path.isfile(source):
+            return False
+        checksum = pkg_checksum(package, repo)
+        if checksum == "None":
+            return False
+        md5s = md5_verified(source)
+        if md5s != checksum:
+            md5s = md5(source)
+            if md5s == checksum:
+                md5_keep(source, md5s)
+        if md5s != checksum:
+            os.remove(source)
+            return False
+        os.utime(source, (time.time(), os.stat(source).st_mtime))
+        return True
+
+    def evict(self):
+        """Remove least recently used packages until the cache fits its
+        size
+        """
+        if not os.path.isdir(self.path):
+            return
+        files, total = [], 0
+        for name in os.listdir(self.path):
+            if not name.endswith((".tgz", ".txz", ".tbz", ".tlz")):
+                continue
+            st = os.stat(self.path + name)
+            files.append((st.st_atime, st.st_size, name))
+            total += st.st_size
+        for atime, size, name in sorted(files):
+            if total <= self.size:
+                break
+            os.remove(self.path + name)
+            total -= size
@@ -36,19 +36,24 @@ from slpkg.checksum import check_md5
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.sbo.greps import SBoGrep
+from slpkg.sbo.cache import link_file
 
 
 class BuildPackage(object):
     """Build SBo packages from source
     """
-    def __init__(self, script, sources, path, auto):
+    def __init__(self, script, sources, path, auto, quiet=False, workers=1):
         self.script = script
         self.sources = sources
         self.path = path
         self.auto = auto
+        self.quiet = quiet
+        self.workers = workers
         self.meta = _meta_
         self.msg = Msg()
         self.prgnam = self.script[:-7]
+        self.tmp = ""
+        self.output = self.meta.output
         self.log_file = "build_{0}_log".format(self.prgnam)
         self.sbo_logs = self.meta.log_path + "sbo/"
         self.build_logs = self.sbo_logs + "build_logs/"
@@ -68,45 +73,82 @@ class BuildPackage(object):
         Also check md5sum calculates.
         """
         try:
-            self._delete_dir()
-            tar = tarfile.open(self.script)
-            tar.extractall()
-            tar.close()
-            self._makeflags()
-            self._delete_sbo_tar_gz()
-            self._create_md5_dict()
-            for src in self.sources:
-                # fix build sources with spaces
-                src = src.replace("%20", " ")
-                check_md5(self.sbo_md5[src], src)
-                shutil.copy2(src, self.prgnam)
-            os.chdir(self.path + self.prgnam)
-            # change permissions
-            subprocess.call("chmod +x {0}.SlackBuild".format(self.prgnam),
-                            shell=True)
-            pass_var = self._pass_variable()
-            if self.meta.sbo_build_log in ["on", "ON"]:
-                if os.path.isfile(self.build_logs + self.log_file):
-                    os.remove(self.build_logs + self.log_file)
-                # start log write
-                log_head(self.build_logs, self.log_file, self.start_log_time)
-                subprocess.Popen("{0} ./{1}.SlackBuild 2>&1 | tee -a "
-                                 "{2}{3}".format(" ".join(pass_var),
-                                                 self.prgnam, self.build_logs,
-                                                 self.log_file), shell=True,
-                                 stdout=sys.stdout).communicate()
-                sum_time = build_time(self.start_time)
-                # write end in log file
-                log_end(self.build_logs, self.log_file, sum_time)
-                print("Total build time for package {0} : {1}\n".format(
-                    self.prgnam, sum_time))
-            else:
-                subprocess.call("{0} ./{1}.SlackBuild".format(
-                    " ".join(pass_var), self.prgnam), shell=True)
-            os.chdir(self.path)
+            self.prepare()
+            self.run()
         except KeyboardInterrupt:   # (OSError, IOError):
             self.msg.pkg_not_found("\n", self.prgnam, "Wrong file", "\n")
 
+    def prepare(self):
+        """Untar SlackBuild archive, check sources md5sum and copy
+        them in the package build directory
+        """
+        self._delete_dir()
+        tar = tarfile.open(self.path + self.script)
+        tar.extractall(self.path)
+        tar.close()
+        self._makeflags()
+        self._delete_sbo_tar_gz()
+        self._create_md5_dict()
+        for src in self.sources:
+            # fix build sources with spaces
+            src = src.replace("%20", " ")
+            check_md5(self.sbo_md5[src], self.path + src)
+            link_file(self.path + src, self.path + self.prgnam + "/" + src)
+
+    def separate(self, path):
+        """Use own TMP and OUTPUT directories inside path so builds
+        running at the same time do not share them
+        """
+        self.tmp = path + "tmp/"
+        self.output = path + "output/"
+
+    def run(self):
+        """Run SlackBuild script inside the package build directory
+        and return its exit status. Quiet builds write the output only
+        to the log file
+        """
+        cwd = self.path + self.prgnam
+        self.start_log_time = time.strftime("%H:%M:%S")
+        self.start_time = time.time()
+        # change permissions
+        subprocess.call("chmod +x {0}.SlackBuild".format(self.prgnam),
+                        shell=True, cwd=cwd)
+        pass_var = self._pass_variable()
+        if self.tmp:
+            for path in [self.tmp, self.output]:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                os.makedirs(path)
+            pass_var += ["TMP={0}".format(self.tmp),
+                         "OUTPUT={0}".format(self.output)]
+        command = "{0} ./{1}.SlackBuild".format(" ".join(pass_var),
+                                                self.prgnam)
+        if self.quiet:
+            if os.path.isfile(self.build_logs + self.log_file):
+                os.remove(self.build_logs + self.log_file)
+            log_head(self.build_logs, self.log_file, self.start_log_time)
+            with open(self.build_logs + self.log_file, "a") as log:
+                code = subprocess.call(command, shell=True, cwd=cwd,
+                                       stdout=log, stderr=subprocess.STDOUT)
+            log_end(self.build_logs, self.log_file,
+                    build_time(self.start_time))
+        elif self.meta.sbo_build_log in ["on", "ON"]:
+            if os.path.isfile(self.build_logs + self.log_file):
+                os.remove(self.build_logs + self.log_file)
+            # start log write
+            log_head(self.build_logs, self.log_file, self.start_log_time)
+            code = subprocess.Popen("{0} 2>&1 | tee -a {1}{2}".format(
+                command, self.build_logs, self.log_file), shell=True,
+                stdout=sys.stdout, cwd=cwd).wait()
+            sum_time = build_time(self.start_time)
+            # write end in log file
+            log_end(self.build_logs, self.log_file, sum_time)
+            print("Total build time for package {0} : {1}\n".format(
+                self.prgnam, sum_time))
+        else:
+            code = subprocess.call(command, shell=True, cwd=cwd)
+        return code
+
     def _create_md5_dict(self):
         """Create md5 dictionary per source
         """
@@ -117,10 +159,10 @@ class BuildPackage(object):
 
     def _makeflags(self):
         """Set variable MAKEFLAGS with the numbers of
-        processors
+        processors, shared by the builds running at the same time
         """
         if self.meta.makeflags in ["on", "ON"]:
-            cpus = multiprocessing.cpu_count()
+            cpus = max(1, multiprocessing.cpu_count() // self.workers)
             os.environ["MAKEFLAGS"] = "-j{0}".format(cpus)
 
     def _pass_variable(self):
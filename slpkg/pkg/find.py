@@ -23,20 +23,50 @@
 
 
 import os
-from slpkg.blacklist import BlackList
+
+from slpkg.blacklist import BlackList, blacklist_mtime
 from slpkg.splitting import split_package
 
 
+# directories listings cached by modification time
+_listings = {}
+
+
 def find_package(find_pkg, directory):
     """Find packages
     """
     pkgs = []
-    if os.path.isdir(directory):
-        installed = sorted(os.listdir(directory))
-        blacklist = BlackList().packages(pkgs=installed, repo="local")
-        if os.path.exists(directory):
-            for pkg in installed:
-                if (not pkg.startswith(".") and pkg.startswith(find_pkg) and
-                        split_package(pkg)[0] not in blacklist):
-                    pkgs.append(pkg)
+    for pkg in _listing(directory)[0]:
+        if pkg.startswith(find_pkg):
+            pkgs.append(pkg)
     return pkgs
+
+
+def package_names(directory):
+    """Return dictionary with packages by name
+    """
+    return _listing(directory)[1]
+
+
+def _listing(directory):
+    """Return sorted packages of directory without blacklisted
+    and the packages by name. Directory is listed again only if
+    itself or blacklist file modified.
+    """
+    if not os.path.isdir(directory):
+        return [], {}
+    stamp = (os.stat(directory).st_mtime, blacklist_mtime())
+    cached = _listings.get(directory)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    pkgs, names = [], {}
+    installed = sorted(os.listdir(directory))
+    blacklist = BlackList().packages(pkgs=installed, repo="local")
+    for pkg in installed:
+        name = split_package(pkg)[0] or ""
+        if not pkg.startswith(".") and name not in blacklist:
+            pkgs.append(pkg)
+            if name:
+                names[name] = pkg
+    _listings[directory] = (stamp, (pkgs, names))
+    return pkgs, names
@@ -22,7 +22,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.pkg.find import find_package
+from slpkg.pkg.find import package_names
 
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
@@ -35,12 +35,7 @@ class GetFromInstalled(object):
     def __init__(self, package):
         self.package = package
         self.meta = _meta_
-        self.files = find_package(self.package + self.meta.sp,
-                                  self.meta.pkg_path)
-        self.find = ""
-        for f in self.files:
-            if split_package(f)[0] == self.package:
-                self.find = f
+        self.find = package_names(self.meta.pkg_path).get(self.package, "")
 
     def version(self):
         """Return version from installed packages
@@ -31,10 +31,15 @@ from slpkg.pkg.installed import GetFromInstalled
 
 from slpkg.utils import Utils
 from slpkg.messages import Msg
+from slpkg.log_deps import remove_deps, dependents
 from slpkg.dialog_box import DialogUtil
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
 
+from slpkg.sbo.index import SBoIndex
+
+from slpkg.binary.index import PackagesIndex
+
 
 class PackageManager(object):
     """Package manager class for install, upgrade,
@@ -50,6 +55,9 @@ class PackageManager(object):
     def install(self, flag):
         """Install Slackware binary packages
         """
+        if self.meta.transaction in ["on", "ON"]:
+            self._batch("installpkg", flag, "Can't install")
+            return
         for pkg in self.binary:
             try:
                 subprocess.call("installpkg {0} {1}".format(flag, pkg),
@@ -65,6 +73,9 @@ class PackageManager(object):
     def upgrade(self, flag):
         """Upgrade Slackware binary packages with new
         """
+        if self.meta.transaction in ["on", "ON"]:
+            self._batch("upgradepkg", flag, "Can't upgrade")
+            return
         for pkg in self.binary:
             try:
                 subprocess.call("upgradepkg {0} {1}".format(flag, pkg),
@@ -77,6 +88,22 @@ class PackageManager(object):
             except subprocess.CalledProcessError:
                 self._not_found("Can't upgrade", self.binary, pkg)
 
+    def _batch(self, command, flag, message):
+        """Run command once for all packages and check installed
+        packages at end
+        """
+        subprocess.call("{0} {1} {2}".format(command, flag,
+                                             " ".join(self.binary)),
+                        shell=True)
+        installed = set(os.listdir(self.meta.pkg_path))
+        failed = [pkg for pkg in self.binary
+                  if pkg[:-4].split("/")[-1] not in installed]
+        if failed:
+            for pkg in failed:
+                self._not_found(message, self.binary, pkg)
+            raise SystemExit()
+        print("Completed!\n")
+
     def _not_found(self, message, binary, pkg):
         if len(binary) > 1:
             bol = eol = ""
@@ -159,8 +186,9 @@ class PackageManager(object):
                 self.msg.pkg_not_found("", "'tag'", "Can't remove", "")
         else:
             for pkg in self.binary:
-                name = GetFromInstalled(pkg).name()
-                ver = GetFromInstalled(pkg).version()
+                installed = GetFromInstalled(pkg)
+                name = installed.name()
+                ver = installed.version()
                 package = find_package("{0}{1}{2}".format(
                     name, ver, self.meta.sp), self.meta.pkg_path)
                 if pkg and name == pkg:
@@ -225,9 +253,9 @@ class PackageManager(object):
         packages = []
         dependencies = (Utils().read_file(path + package)).splitlines()
         for dep in dependencies:
-            if GetFromInstalled(dep).name():
-                ver = GetFromInstalled(dep).version()
-                packages.append(dep + ver)
+            installed = GetFromInstalled(dep)
+            if installed.name():
+                packages.append(dep + installed.version())
             else:
                 dependencies.remove(dep)
         if packages:
@@ -266,8 +294,7 @@ class PackageManager(object):
         try:
             subprocess.call("removepkg {0} {1}".format(self.flag, package),
                             shell=True)
-            if os.path.isfile(self.dep_path + package):
-                os.remove(self.dep_path + package)  # remove log
+            remove_deps(package)    # remove log
         except subprocess.CalledProcessError as er:
             print(er)
             raise SystemExit()
@@ -279,9 +306,9 @@ class PackageManager(object):
         dependencies.append(package)
         self._check_if_used(dependencies)
         for dep in dependencies:
-            if dep not in self.skip and GetFromInstalled(dep).name():
-                ver = GetFromInstalled(dep).version()
-                removes.append(dep + ver)
+            installed = GetFromInstalled(dep)
+            if dep not in self.skip and installed.name():
+                removes.append(dep + installed.version())
                 self._removepkg(dep)
         return removes
 
@@ -289,9 +316,9 @@ class PackageManager(object):
         """Remove one signle package
         """
         removes = []
-        if GetFromInstalled(package).name() and package not in self.skip:
-            ver = GetFromInstalled(package).version()
-            removes.append(package + ver)
+        installed = GetFromInstalled(package)
+        if installed.name() and package not in self.skip:
+            removes.append(package + installed.version())
             self._removepkg(package)
         return removes
 
@@ -315,16 +342,18 @@ class PackageManager(object):
         """Check package if dependencies for another package
         before removed"""
         if "--check-deps" in self.extra:
-            package, dependency, pkg_dep = [], [], []
-            for pkg in find_package("", self.dep_path):
-                deps = Utils().read_file(self.dep_path + pkg)
-                for rmv in removes:
-                    if GetFromInstalled(rmv).name() and rmv in deps.split():
-                        pkg_dep.append(
-                            "{0} is dependency of the package --> {1}".format(
-                                rmv, pkg))
-                        package.append(pkg)
-                        dependency.append(rmv)
+            package, dependency, pkg_dep, used = [], [], [], []
+            index = dependents()
+            for rmv in removes:
+                if GetFromInstalled(rmv).name():
+                    for pkg in index.get(rmv, []):
+                        used.append((pkg, removes.index(rmv), rmv))
+            for pkg, order, rmv in sorted(used):
+                pkg_dep.append(
+                    "{0} is dependency of the package --> {1}".format(
+                        rmv, pkg))
+                package.append(pkg)
+                dependency.append(rmv)
             if package:
                 if "--checklist" in self.extra:
                     text = ("Press 'spacebar' to choose packages to exception "
@@ -416,8 +445,9 @@ class PackageManager(object):
         """Print the Slackware packages contents
         """
         for pkg in self.binary:
-            name = GetFromInstalled(pkg).name()
-            ver = GetFromInstalled(pkg).version()
+            installed = GetFromInstalled(pkg)
+            name = installed.name()
+            ver = installed.version()
             find = find_package("{0}{1}{2}".format(name, ver, self.meta.sp),
                                 self.meta.pkg_path)
             if find:
@@ -482,34 +512,27 @@ class PackageManager(object):
         """Grep packages
         """
         pkg_list, pkg_size = [], []
-        for line in packages.splitlines():
-            if repo == "sbo":
-                if line.startswith("SLACKBUILD NAME: "):
-                    pkg_list.append(line[17:].strip())
-                    pkg_size.append("0 K")
-            else:
-                if line.startswith("PACKAGE NAME: "):
-                    pkg_list.append(line[15:].strip())
-                if line.startswith("PACKAGE SIZE (compressed): "):
-                    pkg_size.append(line[26:].strip())
+        if repo == "sbo":
+            for name in packages["names"]:
+                pkg_list.append(name)
+                pkg_size.append("0 K")
+        else:
+            for record in packages["records"]:
+                pkg_list.append(record["name"])
+                pkg_size.append("{0} K".format(record["size"]))
         if repo == "alien":
             return alien_filter(pkg_list, pkg_size)
         return pkg_list, pkg_size
 
     def list_lib(self, repo):
-        """Return package lists
+        """Return package lists index
         """
         if repo == "sbo":
-            if (os.path.isfile(
-                    self.meta.lib_path + "{0}_repo/SLACKBUILDS.TXT".format(
-                        repo))):
-                packages = Utils().read_file(self.meta.lib_path + "{0}_repo/"
-                                             "SLACKBUILDS.TXT".format(repo))
+            if SBoIndex().exists():
+                packages = SBoIndex().load()
         else:
-            if (os.path.isfile(
-                    self.meta.lib_path + "{0}_repo/PACKAGES.TXT".format(repo))):
-                packages = Utils().read_file(self.meta.lib_path + "{0}_repo/"
-                                             "PACKAGES.TXT".format(repo))
+            if PackagesIndex(repo).exists():
+                packages = PackagesIndex(repo).load()
         return packages
 
     def list_color_tag(self, pkg):
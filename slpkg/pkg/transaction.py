@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# transaction.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+
+from slpkg.splitting import split_package
+from slpkg.__metadata__ import MetaData as _meta_
+
+from slpkg.pkg.manager import PackageManager
+
+
+class Transaction(object):
+    """Install or upgrade a set of binary packages. Installed packages
+    are read once when the transaction starts and, if TRANSACTION is
+    "on", packages following each other with the same upgradepkg flag
+    are upgraded together by one command at commit, else every package
+    is upgraded when added
+    """
+    def __init__(self):
+        self.meta = _meta_
+        self.batch = self.meta.transaction in ["on", "ON"]
+        self.groups = []
+        self.packages = set()
+        self.names = set()
+        if os.path.isdir(self.meta.pkg_path):
+            self.packages = set(os.listdir(self.meta.pkg_path))
+            self.names = set([split_package(pkg)[0]
+                              for pkg in self.packages])
+
+    def exists(self, package):
+        """Return True if the same package is installed
+        """
+        return package[:-4].split("/")[-1] in self.packages
+
+    def installed(self, name):
+        """Return True if a package with the same name is installed
+        """
+        return name in self.names
+
+    def add(self, package, flag):
+        """Add package to upgrade with upgradepkg flag
+        """
+        if not self.batch:
+            PackageManager([package]).upgrade(flag)
+        elif self.groups and self.groups[-1][0] == flag:
+            self.groups[-1][1].append(package)
+        else:
+            self.groups.append((flag, [package]))
+
+    def commit(self):
+        """Upgrade added packages in order
+        """
+        for flag, packages in self.groups:
+            PackageManager(packages).upgrade(flag)
+        self.groups = []
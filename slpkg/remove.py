@@ -24,12 +24,15 @@
 
 import os
 
+from slpkg.packages_cache import PackagesCache
 from slpkg.__metadata__ import MetaData as _meta_
 
 
 def delete_package(path, packages):
-    """Remove downloaded packages
+    """Remove downloaded packages or keep them in packages cache
     """
     if _meta_.del_all in ["on", "ON"]:
         for pkg in packages:
             os.remove(path + pkg)
+    else:
+        PackagesCache(path).evict()
@@ -30,6 +30,10 @@ from slpkg.repositories import Repo
 from slpkg.repolist import RepoList
 from slpkg.__metadata__ import MetaData as _meta_
 
+from slpkg.sbo.index import SBoIndex
+
+from slpkg.binary.index import PackagesIndex
+
 
 class RepoInfo(object):
     """Repository information
@@ -62,8 +66,7 @@ class RepoInfo(object):
         if repo in self.meta.default_repositories:
             self.form["Default:"] = "yes"
         if (repo in self.meta.repositories and
-                os.path.isfile(self.meta.lib_path + "{0}_repo/PACKAGES."
-                               "TXT".format(repo))):
+                PackagesIndex(repo).exists()):
             status = "{0}enabled{1}".format(self.meta.color["GREEN"],
                                             self.meta.color["ENDC"])
             if repo != "sbo":
@@ -82,12 +85,7 @@ class RepoInfo(object):
                                                "SLACKBUILDS.TXT".format(repo))):
             status = "{0}enabled{1}".format(self.meta.color["GREEN"],
                                             self.meta.color["ENDC"])
-            sum_sbo_pkgs = 0
-            for line in (Utils().read_file(
-                    self.meta.lib_path + "sbo_repo/SLACKBUILDS."
-                    "TXT").splitlines()):
-                if line.startswith("SLACKBUILD NAME: "):
-                    sum_sbo_pkgs += 1
+            sum_sbo_pkgs = len(SBoIndex().load()["names"])
             changelog_txt = Utils().read_file(
                 self.meta.log_path + "sbo/ChangeLog.txt")
             last_upd = changelog_txt.split("\n", 1)[0]
@@ -108,17 +106,13 @@ class RepoInfo(object):
         """
         Grap data packages
         """
-        sum_pkgs, size, unsize, last_upd = 0, [], [], ""
-        for line in (Utils().read_file(
-                self.meta.lib_path + repo + "_repo/PACKAGES.TXT").splitlines()):
-            if line.startswith("PACKAGES.TXT;"):
-                last_upd = line[14:].strip()
-            if line.startswith("PACKAGE NAME:"):
-                sum_pkgs += 1
-            if line.startswith("PACKAGE SIZE (compressed):  "):
-                size.append(line[28:-2].strip())
-            if line.startswith("PACKAGE SIZE (uncompressed):  "):
-                unsize.append(line[30:-2].strip())
+        data = PackagesIndex(repo).load()
+        sum_pkgs = len(data["records"])
+        size = [record["size"] for record in data["records"]
+                if record["size"]]
+        unsize = [record["unsize"] for record in data["records"]
+                  if record["unsize"]]
+        last_upd = data.get("updated", "")
         if repo in ["salix", "slackl"]:
             log = Utils().read_file(
                 self.meta.log_path + "{0}/ChangeLog.txt".format(repo))
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# resolver.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+from slpkg.toolbar import status
+
+
+class Resolver(object):
+    """Resolving dependencies over a requirements graph. Every package
+    is resolved once, its dependencies closure is kept and reused by all
+    the packages which depend on it. Requires is called with a package
+    name and returns its direct requirements.
+    """
+    def __init__(self, requires):
+        self.requires = requires
+        self.direct = {}
+        self.closure = {}
+        self.cycles = []
+
+    def resolve(self, name):
+        """Return all dependencies of a package in installation
+        order, dependencies before the packages that need them
+        """
+        if name not in self.closure:
+            self._resolve(name)
+        return list(self.closure[name])
+
+    def dag(self, names):
+        """Return installation order for all dependencies of names and
+        the dependencies dictionary by package
+        """
+        order, deps_dict = [], {}
+        for name in names:
+            for dep in self.resolve(name):
+                if dep not in deps_dict:
+                    order.append(dep)
+                    deps_dict[dep] = self.resolve(dep)
+            deps_dict[name] = self.resolve(name)
+        return order, deps_dict
+
+    def _direct(self, name):
+        """Return package requirements once
+        """
+        if name not in self.direct:
+            self.direct[name] = self.requires(name)
+        return self.direct[name]
+
+    def _resolve(self, name):
+        """Walk dependencies graph with explicit stack and store the
+        closure of each node after its dependencies. Requirements that
+        point back to a package in the current path are cycles, they
+        are recorded and skipped.
+        """
+        stack = [(name, iter(self._direct(name)))]
+        path = set([name])
+        while stack:
+            node, requires = stack[-1]
+            for req in requires:
+                status()
+                if req in self.closure:
+                    continue
+                if req in path:
+                    self.cycles.append((node, req))
+                    continue
+                path.add(req)
+                stack.append((req, iter(self._direct(req))))
+                break
+            else:
+                stack.pop()
+                path.discard(node)
+                self.closure[node] = self._merge(node)
+
+    def _merge(self, node):
+        """Return node dependencies closure from its requirements
+        """
+        order, seen = [], set([node])
+        for req in self._direct(node):
+            for dep in self.closure.get(req, []) + [req]:
+                if dep not in seen:
+                    seen.add(dep)
+                    order.append(dep)
+        return order
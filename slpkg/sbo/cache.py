@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# cache.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import time
+import shutil
+import socket
+import subprocess
+
+from slpkg.md5sum import md5, md5_verified, md5_keep
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+def link_file(source, target):
+    """Hardlink source to target, reflink or copy if the files are not
+    in the same file system
+    """
+    if os.path.isfile(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        copy_file(source, target)
+
+
+def copy_file(source, target):
+    """Reflink source to target, copy if the file system does not
+    support it
+    """
+    if os.path.isfile(target):
+        os.remove(target)
+    if subprocess.call(["cp", "--reflink=auto", "--preserve=timestamps",
+                        source, target]) != 0:
+        shutil.copy2(source, target)
+
+
+class SourceCache(object):
+    """Sources cache by SBo MD5SUM. Files are copied in the cache and
+    linked read only out of it, a file changed since it was verified is
+    checked again when taken. Files are added with a temporary name and
+    renamed, the cache directory can be shared over NFS by many hosts.
+    Last use is kept in access time, modification time is part of the
+    verified md5sum state. The least recently used files are removed
+    when cache is bigger than SOURCE_CACHE_SIZE MB
+    """
+    def __init__(self):
+        self.meta = _meta_
+        self.path = self.meta.source_cache
+        if not self.path.endswith("/"):
+            self.path += "/"
+        try:
+            self.size = int(self.meta.source_cache_size) * 1024 * 1024
+        except ValueError:
+            self.size = 0
+        self.enabled = self.meta.source_cache not in ["off", "OFF", ""]
+
+    def take(self, path, sources):
+        """Link cached (link, checksum) sources in path and return the
+        links found. A cached file not matching its checksum is removed
+        """
+        found = []
+        if not self.enabled:
+            return found
+        for link, checksum in sources:
+            cached = self._file(checksum)
+            target = path + link.split("/")[-1].replace("%20", " ")
+            try:
+                if md5_verified(cached) != checksum:
+                    if md5(cached) != checksum:
+                        os.remove(cached)
+                        continue
+                    md5_keep(cached, checksum)
+                os.utime(cached, (time.time(), os.stat(cached).st_mtime))
+                link_file(cached, target)
+            except (IOError, OSError):
+                continue
+            found.append(link)
+        return found
+
+    def put(self, source, checksum):
+        """Add verified source file in cache
+        """
+        if not self.enabled:
+            return
+        cached = self._file(checksum)
+        if os.path.isfile(cached):
+            return
+        tmp = "{0}.{1}.{2}.tmp".format(cached, socket.gethostname(),
+                                       os.getpid())
+        try:
+            if not os.path.isdir(os.path.dirname(cached)):
+                os.makedirs(os.path.dirname(cached))
+        except OSError:
+            pass
+        try:
+            copy_file(source, tmp)
+            os.chmod(tmp, 0o444)
+            os.rename(tmp, cached)
+            md5_keep(cached, checksum)
+        except (IOError, OSError):
+            if os.path.isfile(tmp):
+                os.remove(tmp)
+
+    def evict(self):
+        """Remove least recently used files until the cache fits its
+        size, temporary files left over for a day are removed
+        """
+        if not self.enabled or not os.path.isdir(self.path):
+            return
+        files, total = [], 0
+        for root, dirs, names in os.walk(self.path):
+            for name in names:
+                cached = os.path.join(root, name)
+                try:
+                    st = os.stat(cached)
+                    if name.endswith(".tmp"):
+                        if st.st_mtime < time.time() - 86400:
+                            os.remove(cached)
+                        continue
+                except OSError:
+                    continue
+                files.append((st.st_atime, st.st_size, cached))
+                total += st.st_size
+        for atime, size, cached in sorted(files):
+            if total <= self.size:
+                break
+            try:
+                os.remove(cached)
+            except OSError:
+                pass
+            total -= size
+
+    def _file(self, checksum):
+        """Return cache file of checksum
+        """
+        return self.path + checksum[:2] + "/" + checksum
@@ -43,7 +43,7 @@ def sbo_upgrade(skip, flag):
     data = SBoGrep(name="").names()
     blacklist = BlackList().packages(pkgs=data, repo="sbo")
     for pkg in sbo_list():
-        status(0.02)
+        status()
         name = split_package(pkg)[0]
         ver = split_package(pkg)[1]
         if (name in data and name not in skip and name not in blacklist):
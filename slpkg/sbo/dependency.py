@@ -22,9 +22,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-import sys
-
-from slpkg.toolbar import status
+from slpkg.resolver import Resolver
 from slpkg.blacklist import BlackList
 from slpkg.__metadata__ import MetaData as _meta_
 
@@ -32,7 +30,7 @@ from slpkg.sbo.greps import SBoGrep
 
 
 class Requires(object):
-    """Resolving SBo dependencies
+    """Resolving SBo dependencies from SlackBuilds requirements
     """
     def __init__(self, flag):
         self.flag = flag
@@ -40,28 +38,38 @@ class Requires(object):
         self.SLACKBUILDS_TXT = SBoGrep(name="").names()
         self.blacklist = BlackList().packages(pkgs=self.SLACKBUILDS_TXT,
                                               repo="sbo")
-        self.dep_results = []
+        self.resolver = Resolver(self._direct)
+        self.cycles = self.resolver.cycles
 
     def sbo(self, name):
-        """Build all dependencies of a package
+        """Return all dependencies of a package in installation
+        order, dependencies before the packages that need them
         """
-        if (self.meta.rsl_deps in ["on", "ON"] and
-                "--resolve-off" not in self.flag):
-            sys.setrecursionlimit(10000)
-            dependencies = []
-            requires = SBoGrep(name).requires()
-            if requires:
-                for req in requires:
-                    status(0.03)
-                    # toolbar_width = status(index, toolbar_width, 1)
-                    # avoid to add %README% as dependency and
-                    # if require in blacklist
-                    if "%README%" not in req and req not in self.blacklist:
-                        dependencies.append(req)
-                if dependencies:
-                    self.dep_results.append(dependencies)
-                    for dep in dependencies:
-                        self.sbo(dep)
-            return self.dep_results
+        if self._enabled():
+            return self.resolver.resolve(name)
         else:
             return []
+
+    def dag(self, names):
+        """Return installation order for all dependencies of names and
+        the dependencies dictionary by package
+        """
+        if self._enabled():
+            return self.resolver.dag(names)
+        return [], dict((name, []) for name in names)
+
+    def _enabled(self):
+        """Return True if dependencies are resolved
+        """
+        return (self.meta.rsl_deps in ["on", "ON"] and
+                "--resolve-off" not in self.flag)
+
+    def _direct(self, name):
+        """Return package requirements without %README% notes and
+        blacklisted packages
+        """
+        dependencies = []
+        for req in SBoGrep(name).requires() or []:
+            if "%README%" not in req and req not in self.blacklist:
+                dependencies.append(req)
+        return dependencies
@@ -22,9 +22,10 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
 from slpkg.__metadata__ import MetaData as _meta_
 
+from slpkg.sbo.index import SBoIndex
+
 
 class SBoGrep(object):
     """Grab data from SLACKBUILDS.TXT file
@@ -33,42 +34,27 @@ class SBoGrep(object):
         self.name = name
         self.meta = _meta_
         arch64 = "x86_64"
-        self.line_name = "SLACKBUILD NAME: "
-        self.line_files = "SLACKBUILD FILES: "
-        self.line_down = "SLACKBUILD DOWNLOAD: "
-        self.line_down_64 = "SLACKBUILD DOWNLOAD_{0}: ".format(arch64)
-        self.line_req = "SLACKBUILD REQUIRES: "
-        self.line_ver = "SLACKBUILD VERSION: "
-        self.line_md5 = "SLACKBUILD MD5SUM: "
-        self.line_md5_64 = "SLACKBUILD MD5SUM_{0}: ".format(arch64)
-        self.line_des = "SLACKBUILD SHORT DESCRIPTION: "
-        self.sbo_txt = self.meta.lib_path + "sbo_repo/SLACKBUILDS.TXT"
+        self.key_down_64 = "DOWNLOAD_{0}".format(arch64)
+        self.key_md5_64 = "MD5SUM_{0}".format(arch64)
         self.answer = ["y", "Y"]
         self.unst = ["UNSUPPORTED", "UNTESTED"]
-        self.SLACKBUILDS_TXT = Utils().read_file(self.sbo_txt)
+        self.index = SBoIndex().load()
+        self.record = self.index["records"].get(self.name, {})
 
     def names(self):
         """Grab all packages name
         """
-        pkg_names = []
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                pkg_names.append(line[17:].strip())
-        return pkg_names
+        return list(self.index["names"])
 
     def source(self):
         """Grab sources downloads links
         """
-        source, source64, = "", ""
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_down):
-                if sbo_name == self.name and line[21:].strip():
-                    source = line[21:]
-            if line.startswith(self.line_down_64):
-                if sbo_name == self.name and line[28:].strip():
-                    source64 = line[28:]
+        source = self.record.get("DOWNLOAD", "")
+        source64 = self.record.get(self.key_down_64, "")
+        if not source.strip():
+            source = ""
+        if not source64.strip():
+            source64 = ""
         return self._select_source_arch(source, source64)
 
     def _select_source_arch(self, source, source64):
@@ -92,36 +78,20 @@ class SBoGrep(object):
     def requires(self):
         """Grab package requirements
         """
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_req):
-                if sbo_name == self.name:
-                    return line[21:].strip().split()
+        if "REQUIRES" in self.record:
+            return self.record["REQUIRES"].strip().split()
 
     def version(self):
         """Grab package version
         """
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_ver):
-                if sbo_name == self.name:
-                    return line[20:].strip()
+        if "VERSION" in self.record:
+            return self.record["VERSION"].strip()
 
     def checksum(self):
         """Grab checksum string
         """
-        md5sum, md5sum64, = [], []
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_md5_64):
-                if sbo_name == self.name and line[26:].strip():
-                    md5sum64 = line[26:].strip().split()
-            if line.startswith(self.line_md5):
-                if sbo_name == self.name and line[19:].strip():
-                    md5sum = line[19:].strip().split()
+        md5sum = self.record.get("MD5SUM", "").strip().split()
+        md5sum64 = self.record.get(self.key_md5_64, "").strip().split()
         return self._select_md5sum_arch(md5sum, md5sum64)
 
     def _select_md5sum_arch(self, md5sum, md5sum64):
@@ -140,19 +110,17 @@ class SBoGrep(object):
     def description(self):
         """Grab package verion
         """
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_des):
-                if sbo_name == self.name:
-                    return line[31:].strip()
+        if "SHORT DESCRIPTION" in self.record:
+            return self.record["SHORT DESCRIPTION"].strip()
 
     def files(self):
         """Grab files
         """
-        for line in self.SLACKBUILDS_TXT.splitlines():
-            if line.startswith(self.line_name):
-                sbo_name = line[17:].strip()
-            if line.startswith(self.line_files):
-                if sbo_name == self.name:
-                    return line[18:].strip()
+        if "FILES" in self.record:
+            return self.record["FILES"].strip()
+
+    def location(self):
+        """Grab package location
+        """
+        if "LOCATION" in self.record:
+            return self.record["LOCATION"].strip()
@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# index.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+from slpkg.index import RepoIndex
+from slpkg.__metadata__ import MetaData as _meta_
+
+
+class SBoIndex(RepoIndex):
+    """Index of SLACKBUILDS.TXT file keyed by SlackBuild name. Every
+    record holds all SLACKBUILD fields as they are in the file.
+    """
+    def __init__(self):
+        self.lib = _meta_.lib_path + "sbo_repo/"
+        super(SBoIndex, self).__init__(self.lib + "SLACKBUILDS.TXT",
+                                       self.lib + "SLACKBUILDS.idx",
+                                       parse_slackbuilds)
+
+
+def parse_slackbuilds(lines):
+    """Parse SLACKBUILDS.TXT lines and return names in file order and
+    records by name
+    """
+    names, records, record = [], {}, None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.startswith("SLACKBUILD "):
+            continue
+        key, sep, value = line[11:].partition(":")
+        value = value[1:]
+        if key == "NAME":
+            name = value.strip()
+            record = {}
+            if name not in records:
+                names.append(name)
+                records[name] = record
+        elif record is not None:
+            record[key] = value
+    return {"names": names, "records": records}
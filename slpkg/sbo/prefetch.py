@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# prefetch.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import threading
+
+from slpkg.downloader import Download
+from slpkg.fetcher import Fetcher, FetchError
+from slpkg.md5sum import md5, md5_keep
+from slpkg.__metadata__ import MetaData as _meta_
+
+from slpkg.sbo.greps import SBoGrep
+from slpkg.sbo.cache import SourceCache
+
+
+class Prefetch(object):
+    """Download and verify SlackBuilds and sources of the next packages
+    in build order in the background while the current package builds,
+    sources found in the sources cache are not downloaded.
+    Packages are prefetched up to PREFETCH packages ahead and only if
+    the build path keeps PREFETCH_SPACE MB free after their files, else
+    they are downloaded when the build reaches them
+    """
+    def __init__(self, path, packages):
+        self.path = path
+        self.packages = packages
+        self.meta = _meta_
+        try:
+            self.lookahead = max(int(self.meta.prefetch), 0)
+        except ValueError:
+            self.lookahead = 0
+        try:
+            self.space = int(self.meta.prefetch_space) * 1024 * 1024
+        except ValueError:
+            self.space = 0
+        self.index = dict((name, i) for i, (name, links) in
+                          enumerate(self.packages))
+        self.current = 0
+        self.fetched = {}
+        self.lock = threading.Condition()
+        self.fetcher = Fetcher(timeout=30)
+        self.cache = SourceCache()
+
+    def start(self):
+        """Start downloading in the background
+        """
+        thread = threading.Thread(target=self._prefetch)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def wait(self, name):
+        """Wait package files and download again in the foreground the
+        files failed in the background
+        """
+        if name not in self.index:
+            return
+        with self.lock:
+            self.current = max(self.current, self.index[name])
+            self.lock.notify_all()
+            while name not in self.fetched:
+                self.lock.wait(1)
+            missing = self.fetched[name]
+        if missing:
+            Download(self.path, missing, repo="sbo").start()
+            links = self.packages[self.index[name]][1]
+            self._keep([source for source in
+                        zip(links[1:], SBoGrep(name).checksum())
+                        if source[0] in missing], [])
+
+    def keep(self):
+        """Keep md5sum of packages sources downloaded without prefetch
+        and add them in cache
+        """
+        for name, links in self.packages:
+            self._keep(zip(links[1:], SBoGrep(name).checksum()), [])
+        self.cache.evict()
+
+    def _prefetch(self):
+        """Download packages in order when they are allowed. If the
+        background download stops all the packages not fetched are
+        left to the foreground
+        """
+        try:
+            for i, (name, links) in enumerate(self.packages):
+                try:
+                    size = self._size(links) if self.lookahead else 0
+                    with self.lock:
+                        while not self._allowed(i, size):
+                            self.lock.wait(1)
+                    missing = self._fetch(name, links)
+                except Exception:
+                    missing = links
+                with self.lock:
+                    self.fetched[name] = missing
+                    self.lock.notify_all()
+            self.cache.evict()
+        finally:
+            with self.lock:
+                for name, links in self.packages:
+                    self.fetched.setdefault(name, links)
+                self.lock.notify_all()
+
+    def _allowed(self, i, size):
+        """Return True if package of size bytes can be downloaded now
+        """
+        if i <= self.current:
+            return True
+        return (i <= self.current + self.lookahead and
+                self._free() - size > self.space)
+
+    def _size(self, links):
+        """Return size of files to download as the servers report it,
+        unknown sizes are not counted
+        """
+        size = 0
+        for link in links:
+            try:
+                status, info = self.fetcher.head(link, {})
+            except FetchError:
+                continue
+            length = info.get("content-length", "")
+            if status == 200 and length.isdigit():
+                size += int(length)
+        return size
+
+    def _free(self):
+        """Return free bytes in build path
+        """
+        stat = os.statvfs(self.path)
+        return stat.f_bavail * stat.f_frsize
+
+    def _fetch(self, name, links):
+        """Take package sources from cache, download the others quietly
+        and keep the sources md5sum if match, return the links failed
+        """
+        sources = zip(links[1:], SBoGrep(name).checksum())
+        cached = self.cache.take(self.path, sources)
+        download = [link for link in links if link not in cached]
+        results = Download(self.path, download, repo="sbo",
+                           quiet=True).start()
+        missing = [link for link, (file_name, downloaded) in
+                   zip(download, results) if not downloaded]
+        self._keep([source for source in sources if source[0] not in missing],
+                   cached)
+        return missing
+
+    def _keep(self, sources, cached):
+        """Keep md5sum of (link, checksum) sources if match and add the
+        downloaded ones in cache
+        """
+        if self.meta.checkmd5 in ["on", "ON"] or self.cache.enabled:
+            for link, checksum in sources:
+                src = self.path + link.split("/")[-1].replace("%20", " ")
+                if link in cached:
+                    md5_keep(src, checksum)
+                elif os.path.isfile(src) and md5(src) == checksum:
+                    md5_keep(src, checksum)
+                    self.cache.put(src, checksum)
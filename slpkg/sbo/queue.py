@@ -26,7 +26,6 @@ import os
 from collections import OrderedDict
 
 from slpkg.utils import Utils
-from slpkg.downloader import Download
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
@@ -36,6 +35,7 @@ from slpkg.pkg.manager import PackageManager
 from slpkg.sbo.greps import SBoGrep
 from slpkg.sbo.compressed import SBoLink
 from slpkg.sbo.search import sbo_search_pkg
+from slpkg.sbo.prefetch import Prefetch
 from slpkg.sbo.slack_find import slack_package
 
 
@@ -130,21 +130,20 @@ class QueuePkgs(object):
         """
         packages = self.packages()
         if packages:
+            if not os.path.exists(self.meta.build_path):
+                os.mkdir(self.meta.build_path)
+            builds, dwn_srcs = [], []
             for pkg in packages:
-                if not os.path.exists(self.meta.build_path):
-                    os.mkdir(self.meta.build_path)
-                sbo_url = sbo_search_pkg(pkg)
-                sbo_dwn = SBoLink(sbo_url).tar_gz()
+                sbo_dwn = SBoLink(sbo_search_pkg(pkg)).tar_gz()
                 source_dwn = SBoGrep(pkg).source().split()
-                sources = []
-                os.chdir(self.meta.build_path)
                 script = sbo_dwn.split("/")[-1]
-                Download(self.meta.build_path, sbo_dwn.split(),
-                         repo="sbo").start()
-                for src in source_dwn:
-                    Download(self.meta.build_path, src.split(),
-                             repo="sbo").start()
-                    sources.append(src.split("/")[-1])
+                sources = [src.split("/")[-1] for src in source_dwn]
+                builds.append((pkg, script, sources))
+                dwn_srcs.append((pkg, sbo_dwn.split() + source_dwn))
+            prefetch = Prefetch(self.meta.build_path, dwn_srcs).start()
+            for pkg, script, sources in builds:
+                prefetch.wait(pkg)
+                os.chdir(self.meta.build_path)
                 BuildPackage(script, sources, self.meta.build_path,
                              auto=False).build()
         else:
@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# scheduler.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import Queue
+import shutil
+import threading
+
+from slpkg.messages import Msg
+from slpkg.__metadata__ import MetaData as _meta_
+
+from slpkg.sbo.slack_find import binary_package
+
+
+class BuildScheduler(object):
+    """Build SlackBuilds of the dependencies graph in parallel. A
+    package starts to build when all its dependencies are installed,
+    every package builds in its own directory with its own log file,
+    TMP and OUTPUT and the packages are installed one by one from the
+    main thread.
+    At the first failure no new build starts and the running builds
+    are left to finish.
+    """
+    def __init__(self, builds, deps_dict, workers, prefetch=None):
+        self.builds = builds
+        self.deps_dict = deps_dict
+        self.workers = workers
+        self.prefetch = prefetch
+        self.meta = _meta_
+        self.msg = Msg()
+        self.done = Queue.Queue()
+        self.failed = []
+
+    def run(self, install):
+        """Build all (prgnam, name, BuildPackage) packages and call
+        install(prgnam, binary) as soon as each one is built. Return
+        False if a build failed
+        """
+        names = set([name for prgnam, name, build in self.builds])
+        pending, installed, running = list(self.builds), set(), 0
+        while pending and not self.failed:
+            ready = [item for item in pending
+                     if self._ready(item[1], names, installed)]
+            if not ready and not running:
+                # circular dependencies, continue with installation order
+                ready = pending[:1]
+            for item in ready[:self.workers - running]:
+                pending.remove(item)
+                if not self._start(item):
+                    self.failed.append(item[0])
+                    break
+                running += 1
+            if not running:
+                break
+            prgnam, name = self._finished(install)
+            running -= 1
+            if name:
+                installed.add(name)
+        while running:
+            self._finished(install)
+            running -= 1
+        return not self.failed
+
+    def _ready(self, name, names, installed):
+        """Return True if all the dependencies going to build are
+        installed
+        """
+        for dep in self.deps_dict.get(name, []):
+            if dep in names and dep not in installed:
+                return False
+        return True
+
+    def _start(self, item):
+        """Prepare package sources and start the build in a new thread.
+        Return False if the sources are not accepted
+        """
+        prgnam, name, build = item
+        try:
+            if self.prefetch:
+                self.prefetch.wait(name)
+            build.prepare()
+        except SystemExit:
+            return False
+        build.separate("{0}jobs/{1}/".format(self.meta.tmp_path, prgnam))
+        print("[ {0}Building{1} ] --> {2}".format(
+            self.meta.color["CYAN"], self.meta.color["ENDC"], prgnam))
+        thread = threading.Thread(target=self._build, args=(item,))
+        thread.daemon = True
+        thread.start()
+        return True
+
+    def _build(self, item):
+        """Run SlackBuild script and put the result in the queue
+        """
+        prgnam, name, build = item
+        try:
+            code = build.run()
+        except (Exception, SystemExit):
+            code = -1
+        self.done.put((item, code))
+
+    def _finished(self, install):
+        """Wait for a build to finish and install the package. Return
+        (prgnam, name), name is empty if the build failed. The binary
+        package is moved from the build OUTPUT to the common one
+        """
+        while True:
+            try:
+                # waiting with timeout keeps Ctrl+C working
+                (prgnam, name, build), code = self.done.get(True, 1)
+                break
+            except Queue.Empty:
+                continue
+        binary = binary_package(prgnam, build.output) if code == 0 else ""
+        if not binary:
+            self.msg.build_FAILED(prgnam)
+            if code == 0:
+                print("No package {0} found in '{1}' after build\n".format(
+                    prgnam, build.output))
+            self.failed.append(prgnam)
+            return prgnam, ""
+        if build.output != self.meta.output:
+            if not os.path.exists(self.meta.output):
+                os.makedirs(self.meta.output)
+            target = self.meta.output + os.path.basename(binary)
+            shutil.move(binary, target)
+            binary = target
+        install(prgnam, [binary])
+        return prgnam, name
@@ -22,9 +22,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-from slpkg.utils import Utils
 from slpkg.repositories import Repo
-from slpkg.__metadata__ import MetaData as _meta_
+
+from slpkg.sbo.greps import SBoGrep
 
 from slpkg.slack.slack_version import slack_ver
 
@@ -35,11 +35,7 @@ def sbo_search_pkg(name):
     """
     repo = Repo().default_repository()["sbo"]
     sbo_url = "{0}{1}/".format(repo, slack_ver())
-    SLACKBUILDS_TXT = Utils().read_file(
-        _meta_.lib_path + "sbo_repo/SLACKBUILDS.TXT")
-    for line in SLACKBUILDS_TXT.splitlines():
-        if line.startswith("SLACKBUILD LOCATION"):
-            sbo_name = (line[23:].split("/")[-1].replace("\n", "")).strip()
-            if name == sbo_name:
-                return (sbo_url + line[23:].strip() + "/")
+    location = SBoGrep(name).location()
+    if location:
+        return (sbo_url + location[2:] + "/")
     return ""
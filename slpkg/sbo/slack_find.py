@@ -33,8 +33,19 @@ from slpkg.pkg.find import find_package
 def slack_package(prgnam):
     """Return maximum binary Slackware package from output directory
     """
+    binary = binary_package(prgnam, _meta_.output)
+    if not binary:
+        Msg().build_FAILED(prgnam)
+        raise SystemExit()
+    return [binary]
+
+
+def binary_package(prgnam, output):
+    """Return path of maximum binary Slackware package in output
+    directory or empty string if not found
+    """
     binaries, cache, binary = [], " ", ""
-    for pkg in find_package(prgnam, _meta_.output):
+    for pkg in find_package(prgnam, output):
         if pkg.startswith(prgnam) and pkg[:-4].endswith("_SBo"):
             binaries.append(pkg)
     for bins in binaries:
@@ -42,6 +53,5 @@ def slack_package(prgnam):
             binary = bins
             cache = binary
     if not binary:
-        Msg().build_FAILED(prgnam)
-        raise SystemExit()
-    return ["".join(_meta_.output + binary)]
+        return ""
+    return output + binary
@@ -27,6 +27,7 @@ import os
 from slpkg.utils import Utils
 from slpkg.messages import Msg
 from slpkg.toolbar import status
+from slpkg.workers import number
 from slpkg.log_deps import write_deps
 from slpkg.blacklist import BlackList
 from slpkg.downloader import Download
@@ -43,6 +44,8 @@ from slpkg.sbo.sbo_arch import SBoArch
 from slpkg.sbo.compressed import SBoLink
 from slpkg.sbo.dependency import Requires
 from slpkg.sbo.search import sbo_search_pkg
+from slpkg.sbo.prefetch import Prefetch
+from slpkg.sbo.scheduler import BuildScheduler
 from slpkg.sbo.slack_find import slack_package
 
 
@@ -84,15 +87,13 @@ class SBoInstall(object):
         self.if_upgrade = if_upgrade
         self.case_insensitive()
         for _sbo in self.slackbuilds:
-            status(0.03)
+            status()
             if _sbo in self.data and _sbo not in self.blacklist:
-                sbo_deps = Requires(self.flag).sbo(_sbo)
-                self.deps += sbo_deps
-                self.deps_dict[_sbo] = self.one_for_all(sbo_deps)
                 self.package_found.append(_sbo)
             else:
                 self.package_not_found.append(_sbo)
-        self.update_deps()
+        self.requires = Requires(self.flag)
+        self.deps, self.deps_dict = self.requires.dag(self.package_found)
 
         if not self.package_found:
             self.match = True
@@ -104,11 +105,11 @@ class SBoInstall(object):
         if (self.meta.rsl_deps in ["on", "ON"] and
                 self.flag != "--resolve-off" and not self.match):
             self.msg.resolving()
-        self.dependencies, dep_src = self.sbo_version_source(
-            self.one_for_all(self.deps))
+        self.dependencies, dep_src = self.sbo_version_source(self.deps)
         if (self.meta.rsl_deps in ["on", "ON"] and
                 self.flag != "--resolve-off" and not self.match):
             self.msg.done()
+        self.msg.circular(self.requires.cycles)
         self.clear_masters()
 
         if self.package_found:
@@ -161,16 +162,6 @@ class SBoInstall(object):
                     if key == name.lower():
                         self.slackbuilds[index] = value
 
-    def update_deps(self):
-        """Update dependencies dictionary with all package
-        """
-        onelist, dependencies = [], []
-        onelist = Utils().dimensional_list(self.deps)
-        dependencies = Utils().remove_dbs(onelist)
-        for dep in dependencies:
-            deps = Requires(self.flag).sbo(dep)
-            self.deps_dict[dep] = self.one_for_all(deps)
-
     def continue_to_install(self):
         """Continue to install ?
         """
@@ -212,26 +203,12 @@ class SBoInstall(object):
         """
         sbo_versions, sources = [], []
         for sbo in slackbuilds:
-            status(0.02)
+            status()
             sbo_ver = "{0}-{1}".format(sbo, SBoGrep(sbo).version())
             sbo_versions.append(sbo_ver)
             sources.append(SBoGrep(sbo).source())
         return [sbo_versions, sources]
 
-    def one_for_all(self, deps):
-        """Because there are dependencies that depend on other
-        dependencies are created lists into other lists.
-        Thus creating this loop create one-dimensional list and
-        remove double packages from dependencies.
-        """
-        requires, dependencies = [], []
-        deps.reverse()
-        # Inverting the list brings the
-        # dependencies in order to be installed.
-        requires = Utils().dimensional_list(deps)
-        dependencies = Utils().remove_dbs(requires)
-        return dependencies
-
     def top_view(self):
         """View top template
         """
@@ -302,9 +279,18 @@ class SBoInstall(object):
         """
         slackbuilds = self.dependencies + self.master_packages
         installs, upgraded, = [], []
+        workers, builds = number(self.meta.build_workers), []
         if not os.path.exists(self.build_folder):
             os.makedirs(self.build_folder)
         os.chdir(self.build_folder)
+        links = self.sources_links(slackbuilds)
+        prefetch = None
+        if "--download-only" in self.flag:
+            Download(self.build_folder, sum([dwn for pkg, dwn in links], []),
+                     repo="sbo").start()
+            Prefetch(self.build_folder, links).keep()
+        else:
+            prefetch = Prefetch(self.build_folder, links).start()
         for prgnam in slackbuilds:
             pkg = "-".join(prgnam.split("-")[:-1])
             installed = "".join(find_package(prgnam, self.meta.pkg_path))
@@ -321,25 +307,57 @@ class SBoInstall(object):
                 self.msg.template(78)
             else:
                 sbo_url = sbo_search_pkg(pkg)
-                sbo_link = SBoLink(sbo_url).tar_gz()
-                script = sbo_link.split("/")[-1]
-                dwn_srcs = sbo_link.split() + src_link
-                Download(self.build_folder, dwn_srcs, repo="sbo").start()
+                script = SBoLink(sbo_url).tar_gz().split("/")[-1]
                 if "--download-only" in self.flag:
                     continue
                 sources = self.filenames(src_link)
+                if workers > 1:
+                    builds.append((prgnam, pkg, BuildPackage(
+                        script, sources, self.build_folder, auto=False,
+                        quiet=True, workers=workers)))
+                    continue
+                if prefetch:
+                    prefetch.wait(pkg)
                 BuildPackage(script, sources, self.build_folder,
                              auto=False).build()
                 binary = slack_package(prgnam)
-                if GetFromInstalled(pkg).name() == pkg:
-                    print("[ {0}Upgrading{1} ] --> {2}".format(
-                        self.meta.color["YELLOW"],
-                        self.meta.color["ENDC"], prgnam))
-                    upgraded.append(prgnam)
-                else:
-                    print("[ {0}Installing{1} ] --> {2}".format(
-                        self.meta.color["GREEN"],
-                        self.meta.color["ENDC"], prgnam))
-                    installs.append(prgnam)
-                PackageManager(binary).upgrade(flag="--install-new")
+                self.install(prgnam, binary, installs, upgraded)
+        if builds and not BuildScheduler(builds, self.deps_dict, workers,
+                                         prefetch).run(
+                lambda prgnam, binary: self.install(prgnam, binary,
+                                                    installs, upgraded)):
+            self.msg.reference(installs, upgraded)
+            raise SystemExit()
         return installs, upgraded
+
+    def install(self, prgnam, binary, installs, upgraded):
+        """Install or upgrade the binary package built from prgnam
+        """
+        pkg = "-".join(prgnam.split("-")[:-1])
+        if GetFromInstalled(pkg).name() == pkg:
+            print("[ {0}Upgrading{1} ] --> {2}".format(
+                self.meta.color["YELLOW"],
+                self.meta.color["ENDC"], prgnam))
+            upgraded.append(prgnam)
+        else:
+            print("[ {0}Installing{1} ] --> {2}".format(
+                self.meta.color["GREEN"],
+                self.meta.color["ENDC"], prgnam))
+            installs.append(prgnam)
+        PackageManager(binary).upgrade(flag="--install-new")
+
+    def sources_links(self, slackbuilds):
+        """Return SlackBuild script and sources links of every package
+        going to build, in build order
+        """
+        dwn_srcs = []
+        for prgnam in slackbuilds:
+            pkg = "-".join(prgnam.split("-")[:-1])
+            installed = "".join(find_package(prgnam, self.meta.pkg_path))
+            src_link = SBoGrep(pkg).source().split()
+            if ((not installed or "--download-only" in self.flag) and
+                    self.unst[0] not in src_link and
+                    self.unst[1] not in src_link):
+                sbo_link = SBoLink(sbo_search_pkg(pkg)).tar_gz()
+                dwn_srcs.append((pkg, sbo_link.split() + src_link))
+        return dwn_srcs
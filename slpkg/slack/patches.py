@@ -35,17 +35,21 @@ from slpkg.toolbar import status
 from slpkg.checksum import check_md5
 from slpkg.blacklist import BlackList
 from slpkg.downloader import Download
+from slpkg.freshness import Freshness
+from slpkg.fetcher import Fetcher, FetchError
 from slpkg.remove import delete_package
+from slpkg.packages_cache import PackagesCache
 from slpkg.grep_md5 import pkg_checksum
 from slpkg.dialog_box import DialogUtil
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
 
 from slpkg.pkg.find import find_package
-from slpkg.pkg.manager import PackageManager
+from slpkg.pkg.transaction import Transaction
 from slpkg.pkg.installed import GetFromInstalled
 
 from slpkg.binary.greps import repo_data
+from slpkg.binary.index import PackagesIndex, parse_packages
 
 from slpkg.slack.mirrors import mirrors
 from slpkg.slack.slack_version import slack_ver
@@ -72,11 +76,7 @@ class Patches(object):
         self.uncomp_sum = []
         self.utils = Utils()
         self.msg.checking()
-        if self.version == "stable":
-            self.PACKAGES_TXT = URL(mirrors("PACKAGES.TXT",
-                                            "patches/")).reading()
-        else:
-            self.PACKAGES_TXT = URL(mirrors("PACKAGES.TXT", "")).reading()
+        self.packages = self.packages_list()
 
     def start(self):
         """
@@ -114,7 +114,7 @@ class Patches(object):
                                             self.meta.color["ENDC"]))
             print("")
             if self.msg.answer() in ["y", "Y"]:
-                Download(self.patch_path, self.dwn_links,
+                Download(self.patch_path, self.not_cached(),
                          repo="slack").start()
                 self.upgrade_all = self.utils.check_downloaded(
                     self.patch_path, self.upgrade_all)
@@ -136,10 +136,10 @@ class Patches(object):
         """
         Store and return packages for upgrading
         """
-        data = repo_data(self.PACKAGES_TXT, "slack", self.flag)
+        data = repo_data(self.packages, "slack")
         black = BlackList().packages(pkgs=data[0], repo="slack")
         for name, loc, comp, uncomp in zip(data[0], data[1], data[2], data[3]):
-            status(0.0003)
+            status()
             repo_pkg_name = split_package(name)[0]
             if (not os.path.isfile(self.meta.pkg_path + name[:-4]) and
                     repo_pkg_name not in black and
@@ -156,6 +156,13 @@ class Patches(object):
                     self.count_upg -= 1
         return self.count_upg
 
+    def not_cached(self):
+        """Return download links of packages not verified in cache
+        """
+        cache = PackagesCache(self.patch_path)
+        return [link for link, pkg in zip(self.dwn_links, self.upgrade_all)
+                if not cache.cached(pkg, "slack_patches")]
+
     def dialog_checklist(self):
         """Create checklist to choose packages for upgrade
         """
@@ -191,10 +198,10 @@ class Patches(object):
         for upg, size in sorted(zip(self.upgrade_all, self.comp_sum)):
             pkg_repo = split_package(upg[:-4])
             color = self.meta.color["RED"]
-            pkg_inst = GetFromInstalled(pkg_repo[0]).name()
-            if pkg_repo[0] == pkg_inst:
+            installed = GetFromInstalled(pkg_repo[0])
+            if pkg_repo[0] == installed.name():
                 color = self.meta.color["YELLOW"]
-            ver = GetFromInstalled(pkg_repo[0]).version()
+            ver = installed.version()
             print("  {0}{1}{2}{3} {4}{5} {6}{7}{8}{9}{10}{11:>12}{12}".format(
                 color, pkg_repo[0] + ver, self.meta.color["ENDC"],
                 " " * (23-len(pkg_repo[0] + ver)), pkg_repo[1],
@@ -207,25 +214,23 @@ class Patches(object):
         """
         Upgrade packages
         """
+        transaction = Transaction()
         for pkg in self.upgrade_all:
             check_md5(pkg_checksum(pkg, "slack_patches"), self.patch_path + pkg)
             pkg_ver = "{0}-{1}".format(split_package(pkg)[0],
                                        split_package(pkg)[1])
-            if find_package(split_package(pkg)[0] + self.meta.sp,
-                            self.meta.pkg_path):
+            if transaction.installed(split_package(pkg)[0]):
                 print("[ {0}upgrading{1} ] --> {2}".format(
                     self.meta.color["YELLOW"], self.meta.color["ENDC"],
                     pkg[:-4]))
-                PackageManager((self.patch_path + pkg).split()).upgrade(
-                    "--install-new")
                 self.upgraded.append(pkg_ver)
             else:
                 print("[ {0}installing{1} ] --> {2}".format(
                     self.meta.color["GREEN"], self.meta.color["ENDC"],
                     pkg[:-4]))
-                PackageManager((self.patch_path + pkg).split()).upgrade(
-                    "--install-new")
                 self.installed.append(pkg_ver)
+            transaction.add(self.patch_path + pkg, "--install-new")
+        transaction.commit()
 
     def kernel(self):
         """
@@ -253,11 +258,47 @@ class Patches(object):
                     subprocess.call("lilo", shell=True)
                     break
 
+    def packages_list(self):
+        """Return index of patches PACKAGES.TXT. The list is kept in
+        slack repository library and downloaded again only if mirror
+        has a new one. If download fails the old list is used and
+        the mirror is checked again next time
+        """
+        if self.version == "stable":
+            url = mirrors("PACKAGES.TXT", "patches/")
+        else:
+            url = mirrors("PACKAGES.TXT", "")
+        index = PackagesIndex("slack", "patches/")
+        fresh = Freshness()
+        try:
+            if not os.path.exists(index.lib + "patches/"):
+                os.makedirs(index.lib + "patches/")
+            if fresh.changed(url, index.source):
+                try:
+                    index.build_from(Fetcher().lines(url, index.source))
+                    fresh.downloaded(url, index.source)
+                except FetchError:
+                    data = URL(url).reading()
+                    if data.strip():    # reading() returns " " if failed
+                        with open(index.source, "w") as f:
+                            f.write(data)
+                        fresh.downloaded(url, index.source)
+            if not index.exists():
+                return parse_packages([])
+            return index.load()
+        except (IOError, OSError):
+            return parse_packages(URL(url).reading().splitlines())
+
     def slackpkg_update(self):
         """This replace slackpkg ChangeLog.txt file with new
         from Slackware official mirrors after update distribution.
         """
-        NEW_ChangeLog_txt = URL(mirrors("ChangeLog.txt", "")).reading()
+        url = mirrors("ChangeLog.txt", "")
+        log = self.meta.log_path + "slack/ChangeLog.txt"
+        if Freshness().changed(url, log):
+            NEW_ChangeLog_txt = URL(url).reading()
+        else:
+            NEW_ChangeLog_txt = self.utils.read_file(log)
         if os.path.isfile(self.meta.slackpkg_lib_path + "ChangeLog.txt.old"):
             os.remove(self.meta.slackpkg_lib_path + "ChangeLog.txt.old")
         if os.path.isfile(self.meta.slackpkg_lib_path + "ChangeLog.txt"):
@@ -25,8 +25,8 @@
 import os
 import sys
 
-from slpkg.utils import Utils
 from slpkg.messages import Msg
+from slpkg.log_deps import dependents
 from slpkg.graph import Graph
 from slpkg.splitting import split_package
 from slpkg.__metadata__ import MetaData as _meta_
@@ -57,19 +57,17 @@ class DependenciesStatus(object):
         """Check all installed packages and create
         dictionary database
         """
+        index = dependents()
         for pkg in self.installed:
             if os.path.isfile(self.meta.pkg_path + pkg):
                 name = split_package(pkg)[0]
-                for log in self.logs:
-                    deps = Utils().read_file(self.dep_path + log)
-                    for dep in deps.splitlines():
-                        if name == dep:
-                            if name not in self.dmap.keys():
-                                self.dmap[name] = [log]
-                                self.count_dep += 1
-                            else:
-                                self.dmap[name] += [log]
-                                self.count_pkg += 1
+                for log in index.get(name, []):
+                    if name not in self.dmap.keys():
+                        self.dmap[name] = [log]
+                        self.count_dep += 1
+                    else:
+                        self.dmap[name] += [log]
+                        self.count_pkg += 1
 
     def show(self):
         """Show dependencies status
@@ -28,13 +28,23 @@ import time
 from slpkg.__metadata__ import MetaData as _meta_
 
 
-def status(sec):
-    """Toolbar progressive status
+# spinner symbols, refresh interval in seconds and drawing state
+_syms = ["\\", "|", "/", "-"]
+_interval = 0.1
+_state = {"index": 0, "time": 0}
+
+
+def status():
+    """Toolbar progressive status. The next symbol is drawn only when
+    the refresh interval passed, so the loops that call this never
+    wait for the toolbar.
     """
     if _meta_.prg_bar in ["on", "ON"]:
-        syms = ["\\", "|", "/", "-"]
-        for sym in syms:
-            sys.stdout.write("\b{0}{1}{2}".format(_meta_.color["GREY"], sym,
+        now = time.time()
+        if now - _state["time"] >= _interval:
+            _state["time"] = now
+            _state["index"] = (_state["index"] + 1) % len(_syms)
+            sys.stdout.write("\b{0}{1}{2}".format(_meta_.color["GREY"],
+                                                  _syms[_state["index"]],
                                                   _meta_.color["ENDC"]))
             sys.stdout.flush()
-            time.sleep(float(sec))
@@ -25,6 +25,7 @@
 from slpkg.utils import Utils
 from slpkg.graph import Graph
 from slpkg.messages import Msg
+from slpkg.log_deps import dependents
 from slpkg.blacklist import BlackList
 from slpkg.__metadata__ import MetaData as _meta_
 
@@ -35,6 +36,7 @@ from slpkg.sbo.dependency import Requires
 from slpkg.sbo.search import sbo_search_pkg
 
 from slpkg.binary.search import search_pkg
+from slpkg.binary.index import PackagesIndex
 from slpkg.binary.dependency import Dependencies
 
 
@@ -55,9 +57,7 @@ class TrackingDeps(object):
         self.cyan = self.meta.color["CYAN"]
         self.red = self.meta.color["RED"]
         self.endc = self.meta.color["ENDC"]
-        self.requires = []
         self.dependencies = []
-        self.dependencies_list = []
         self.deps_dict = {}
         for i in range(0, len(self.flag)):
             if self.flag[i].startswith("--graph="):
@@ -70,9 +70,6 @@ class TrackingDeps(object):
         self.msg.resolving()
         self.repositories()
         if self.find_pkg:
-            self.dependencies_list.reverse()
-            self.requires = Utils().dimensional_list(self.dependencies_list)
-            self.dependencies = Utils().remove_dbs(self.requires)
             if self.dependencies == []:
                 self.dependencies = ["No dependencies"]
             if "--graph=" in self.flag:
@@ -128,18 +125,15 @@ class TrackingDeps(object):
             self.sbo_case_insensitive()
             self.find_pkg = sbo_search_pkg(self.name)
             if self.find_pkg:
-                self.dependencies_list = Requires(self.flag).sbo(self.name)
+                self.dependencies = Requires(self.flag).sbo(self.name)
         else:
-            PACKAGES_TXT = Utils().read_file(
-                self.meta.lib_path + "{0}_repo/PACKAGES.TXT".format(self.repo))
-            self.names = Utils().package_name(PACKAGES_TXT)
+            self.names = PackagesIndex(self.repo).load()["names"]
             self.bin_case_insensitive()
             self.find_pkg = search_pkg(self.name, self.repo)
             if self.find_pkg:
                 self.black = BlackList().packages(self.names, self.repo)
-                self.dependencies_list = Dependencies(
-                    self.names, self.repo, self.black).binary(self.name,
-                                                              self.flag)
+                self.dependencies = Dependencies(
+                    self.repo, self.black).binary(self.name, self.flag)
 
     def sbo_case_insensitive(self):
         """Matching packages distinguish between uppercase and
@@ -170,31 +164,24 @@ class TrackingDeps(object):
     def check_used(self, pkg):
         """Check if dependencies used
         """
-        used = []
-        dep_path = self.meta.log_path + "dep/"
-        logs = find_package("", dep_path)
-        for log in logs:
-            deps = Utils().read_file(dep_path + log)
-            for dep in deps.splitlines():
-                if pkg == dep:
-                    used.append(log)
-        return used
+        return list(dependents().get(pkg, []))
 
     def deps_tree(self):
         """Package dependencies image map file
         """
         dependencies = self.dependencies + [self.name]
         if self.repo == "sbo":
+            requires = Requires(flag="")
             for dep in dependencies:
-                deps = Requires(flag="").sbo(dep)
+                deps = requires.sbo(dep)
                 if dep not in self.deps_dict.values():
-                    self.deps_dict[dep] = Utils().dimensional_list(deps)
+                    self.deps_dict[dep] = deps
         else:
+            requires = Dependencies(self.repo, self.black)
             for dep in dependencies:
-                deps = Dependencies(self.names, self.repo,
-                                    self.black).binary(dep, flag="")
+                deps = requires.binary(dep, flag="")
                 if dep not in self.deps_dict.values():
-                    self.deps_dict[dep] = Utils().dimensional_list(deps)
+                    self.deps_dict[dep] = deps
 
     def deps_used(self, pkg, used):
         """Create dependencies dictionary
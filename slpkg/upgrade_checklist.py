@@ -36,8 +36,9 @@ def choose_upg(packages):
     selected_packages, data = [], []
     if packages:
         for pkg in packages:
-            name = GetFromInstalled(pkg).name()
-            ver = GetFromInstalled(pkg).version()
+            inst = GetFromInstalled(pkg)
+            name = inst.name()
+            ver = inst.version()
             binary = "{0}{1}".format(name, ver)
             installed = find_package(binary + _meta_.sp, _meta_.pkg_path)[0]
             data.append(installed)
@@ -24,8 +24,6 @@
 
 import os
 
-from slpkg.splitting import split_package
-
 
 class Utils(object):
     """Class with usefull utilities
@@ -64,15 +62,6 @@ class Utils(object):
             file_txt.close()
             return read_file
 
-    def package_name(self, PACKAGES_TXT):
-        """Returns list with all the names of packages repository
-        """
-        packages = []
-        for line in PACKAGES_TXT.splitlines():
-            if line.startswith("PACKAGE NAME:"):
-                packages.append(split_package(line[14:].strip())[0])
-        return packages
-
     def check_downloaded(self, path, maybe_downloaded):
         """Check if files downloaded and return downloaded
         packages
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# workers.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import time
+import threading
+
+
+class Timeout(Exception):
+    """Task did not finish in time
+    """
+    pass
+
+
+def number(value):
+    """Return workers number from configuration value
+    """
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def ordered_map(func, items, workers, timeout=0):
+    """Run func for every item with worker threads and yield
+    (item, result, error) in items order. A task running longer than
+    timeout seconds is reported with Timeout error and left behind,
+    a new worker takes its place so the rest are not delayed
+    """
+    items = list(items)
+    pending = list(enumerate(items))
+    results, started = {}, {}
+    lock = threading.Condition()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                index, item = pending.pop(0)
+                started[index] = time.time()
+            try:
+                result = (func(item), None)
+            except (Exception, SystemExit) as e:
+                result = (None, e)
+            with lock:
+                results.setdefault(index, result)
+                lock.notify_all()
+
+    def spawn():
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    for i in range(min(workers, len(items))):
+        spawn()
+    for index, item in enumerate(items):
+        with lock:
+            while index not in results:
+                if (timeout and index in started and
+                        time.time() - started[index] > timeout):
+                    results[index] = (None, Timeout(item))
+                    spawn()
+                    break
+                lock.wait(0.5)
+            result, error = results[index]
+        yield item, result, error
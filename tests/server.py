@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# server.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import threading
+import BaseHTTPServer
+import SocketServer
+
+
+class LocalServer(object):
+    """HTTP server in a thread serving files from memory. Files in
+    short are cut after the number of bytes, Range headers received are
+    kept in ranges
+    """
+    def __init__(self):
+        self.files = {}
+        self.short = {}
+        self.ranges = []
+        server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                server.request(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = _Server(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:{0}".format(self.httpd.server_port)
+        thread = threading.Thread(target=self.httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def request(self, handler):
+        """Answer GET request with a file or a part of it
+        """
+        data = self.files.get(handler.path)
+        if data is None:
+            handler.send_error(404)
+            return
+        rng = handler.headers.getheader("range")
+        if rng:
+            self.ranges.append(rng)
+            start = int(rng.split("=")[1].split("-")[0])
+            handler.send_response(206)
+            handler.send_header("Content-Range", "bytes {0}-{1}/{2}".format(
+                start, len(data) - 1, len(data)))
+            data = data[start:]
+        else:
+            handler.send_response(200)
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data[:self.short.pop(handler.path, len(data))])
+
+    def stop(self):
+        """Stop server
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
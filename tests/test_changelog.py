@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# test_changelog.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.server import LocalServer
+
+from slpkg.__metadata__ import MetaData as _meta_
+from slpkg.init import Initialization
+
+
+OLD_LOG = """Sat Oct 17 12:00:00 UTC 2026
+pkgs/foo-1.0-x86_64-1.txz:  Added.
+"""
+
+PACKAGES = """PACKAGES.TXT;  Sat Oct 17 12:00:00 UTC 2026
+
+PACKAGE NAME:  foo-1.0-x86_64-1.txz
+PACKAGE LOCATION:  ./pkgs
+PACKAGE SIZE (compressed):  10 K
+PACKAGE SIZE (uncompressed):  20 K
+PACKAGE DESCRIPTION:
+foo: foo (test package)
+
+PACKAGE NAME:  bar-1.0-x86_64-1.txz
+PACKAGE LOCATION:  ./pkgs
+PACKAGE SIZE (compressed):  10 K
+PACKAGE SIZE (uncompressed):  20 K
+PACKAGE DESCRIPTION:
+bar: bar (test package)
+
+"""
+
+CHECKSUMS = """0123456789abcdef0123456789abcdef  ./pkgs/foo-1.0-x86_64-1.txz
+0123456789abcdef0123456789abcdef  ./pkgs/foo-1.0-x86_64-1.txt
+0123456789abcdef0123456789abcdef  ./pkgs/bar-1.0-x86_64-1.txz
+"""
+
+REMOTE = "PACKAGES.TXT;  Sun Oct 18 12:00:00 UTC 2026\n"
+
+
+class TestChangeLogDelta(unittest.TestCase):
+    """Update of a repository from the new ChangeLog entries served by
+    a local HTTP server
+    """
+    def setUp(self):
+        self.path = tempfile.mkdtemp() + "/"
+        self.saved = (_meta_.lib_path, _meta_.log_path, _meta_.incremental,
+                      _meta_.compressed, _meta_.downder)
+        _meta_.lib_path = self.path + "lib/"
+        _meta_.log_path = self.path + "log/"
+        _meta_.incremental = "on"
+        _meta_.compressed = "off"
+        _meta_.downder = "native"
+        self.log = _meta_.log_path + "test/"
+        self.lib = _meta_.lib_path + "test_repo/"
+        os.makedirs(self.log)
+        os.makedirs(self.lib)
+        for path, data in [(self.log + "ChangeLog.txt", OLD_LOG),
+                           (self.lib + "PACKAGES.TXT", PACKAGES),
+                           (self.lib + "CHECKSUMS.md5", CHECKSUMS)]:
+            with open(path, "w") as f:
+                f.write(data)
+        self.server = LocalServer()
+        self.server.files["/PACKAGES.TXT"] = REMOTE
+        self.server.files["/CHECKSUMS.md5"] = ""
+
+    def tearDown(self):
+        self.server.stop()
+        (_meta_.lib_path, _meta_.log_path, _meta_.incremental,
+         _meta_.compressed, _meta_.downder) = self.saved
+        shutil.rmtree(self.path)
+
+    def update(self, entries):
+        """Serve ChangeLog with the new entries and update repository
+        """
+        remote = "Sun Oct 18 12:00:00 UTC 2026\n" + entries + OLD_LOG
+        self.server.files["/ChangeLog.txt"] = remote
+        init = Initialization(False)
+        init.quiet = True
+        url = self.server.url + "/"
+        init.remote(self.log, url + "ChangeLog.txt", self.lib,
+                    url + "PACKAGES.TXT", url + "CHECKSUMS.md5", "", "test")
+        with open(self.log + "ChangeLog.txt") as f:
+            self.assertEqual(f.read(), remote)
+        self.assertEqual(init.failed, [])
+
+    def read(self, name):
+        with open(self.lib + name) as f:
+            return f.read()
+
+    def test_patched(self):
+        self.update("pkgs/foo-1.0-x86_64-1.txz:  Removed.\n"
+                    "source/foo/foo.SlackBuild:  Removed.\n"
+                    "isolinux/initrd.img:  Rebuilt.\n")
+        self.assertEqual(self.read("PACKAGES.TXT"),
+                         PACKAGES[:PACKAGES.index("PACKAGE NAME:")] +
+                         PACKAGES[PACKAGES.index("PACKAGE NAME:  bar"):])
+        self.assertEqual(self.read("CHECKSUMS.md5"), CHECKSUMS.splitlines(
+            True)[2])
+        self.assertEqual(self.server.ranges, ["bytes=0-65535"])
+
+    def test_full(self):
+        self.update("pkgs/foo-1.1-x86_64-1.txz:  Upgraded.\n")
+        self.assertEqual(self.read("PACKAGES.TXT"), REMOTE)
+        self.assertEqual(self.read("CHECKSUMS.md5"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
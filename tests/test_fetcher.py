@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# test_fetcher.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import io
+import os
+import gzip
+import shutil
+import tempfile
+import unittest
+
+from tests.server import LocalServer
+
+from slpkg.__metadata__ import MetaData as _meta_
+from slpkg.fetcher import Fetcher, FetchError
+from slpkg.downloader import Download, DownloadError
+
+
+class TestFetcher(unittest.TestCase):
+    """Native downloader against a local HTTP server
+    """
+    def setUp(self):
+        self.path = tempfile.mkdtemp() + "/"
+        self.server = LocalServer()
+        self.data = os.urandom(1000)
+        self.server.files["/pkg.txz"] = self.data
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.path)
+
+    def test_get(self):
+        target = Fetcher().get(self.server.url + "/pkg.txz", self.path)
+        with open(target, "rb") as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_short_read_resume(self):
+        self.server.short["/pkg.txz"] = 100
+        url = self.server.url + "/pkg.txz"
+        with self.assertRaises(FetchError):
+            Fetcher().get(url, self.path)
+        self.assertFalse(os.path.isfile(self.path + "pkg.txz"))
+        self.assertEqual(os.path.getsize(self.path + "pkg.txz.part"), 100)
+        Fetcher().get(url, self.path)
+        self.assertEqual(self.server.ranges, ["bytes=100-"])
+        with open(self.path + "pkg.txz", "rb") as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertFalse(os.path.isfile(self.path + "pkg.txz.part"))
+
+    def test_not_found(self):
+        with self.assertRaises(FetchError) as error:
+            Fetcher().get(self.server.url + "/missing.txz", self.path)
+        self.assertEqual(error.exception.status, 404)
+
+    def test_lines_gz(self):
+        self.server.files["/LIST.gz"] = _gzip("line\n" * 10000)
+        lines = list(Fetcher().lines(self.server.url + "/LIST.gz",
+                                     self.path + "LIST", gz=True))
+        self.assertEqual(lines, ["line\n"] * 10000)
+        self.assertTrue(os.path.isfile(self.path + "LIST"))
+
+    def test_lines_gz_truncated(self):
+        self.server.files["/LIST.gz"] = _gzip("line\n" * 10000)[:-4]
+        with self.assertRaises(FetchError):
+            list(Fetcher().lines(self.server.url + "/LIST.gz",
+                                 self.path + "LIST", gz=True))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_lines_short_read(self):
+        self.server.files["/LIST"] = "line\n" * 100
+        self.server.short["/LIST"] = 50
+        with self.assertRaises(FetchError):
+            list(Fetcher().lines(self.server.url + "/LIST",
+                                 self.path + "LIST"))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_download_errors(self):
+        downder = _meta_.downder
+        _meta_.downder = "native"
+        try:
+            download = Download(self.path, [self.server.url + "/pkg.txz",
+                                            self.server.url + "/missing.txz"],
+                                repo="slack")
+            with self.assertRaises(DownloadError) as error:
+                download.start()
+        finally:
+            _meta_.downder = downder
+        self.assertEqual(list(error.exception.errors), ["missing.txz"])
+        self.assertEqual(error.exception.errors["missing.txz"].status, 404)
+        self.assertEqual(download.results, [("pkg.txz", True),
+                                            ("missing.txz", False)])
+
+
+def _gzip(data):
+    """Return data gzip compressed
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# test_scheduler.py file is part of slpkg.
+
+# Copyright 2014-2015 Dimitris Zlatanidis <d.zlatanidis@gmail.com>
+# All rights reserved.
+
+# Slpkg is a user-friendly package manager for Slackware installations
+
+# https://github.com/dslackw/slpkg
+
+# Slpkg is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from slpkg.__metadata__ import MetaData as _meta_
+from slpkg.pkg import build
+from slpkg.pkg.build import BuildPackage
+from slpkg.sbo.scheduler import BuildScheduler
+
+
+SLACKBUILD = """#!/bin/sh
+PRGNAM={0}
+TMP=${{TMP:-/tmp/SBo}}
+OUTPUT=${{OUTPUT:-/tmp}}
+mkdir -p $TMP/package-$PRGNAM $OUTPUT
+echo $TMP > $TMP/package-$PRGNAM/tmp
+{1}
+"""
+
+PACKAGE = ("tar -czf $OUTPUT/$PRGNAM-1.0-noarch-1_SBo.tgz "
+           "-C $TMP/package-$PRGNAM .")
+
+
+class _Checksums(object):
+
+    def __init__(self, prgnam):
+        pass
+
+    def checksum(self):
+        return []
+
+
+class TestScheduler(unittest.TestCase):
+    """Parallel builds of dummy SlackBuilds
+    """
+    def setUp(self):
+        self.path = tempfile.mkdtemp() + "/"
+        self.saved = (_meta_.output, _meta_.log_path, _meta_.tmp_path,
+                      build.SBoGrep)
+        _meta_.output = self.path + "output/"
+        _meta_.log_path = self.path + "log/"
+        _meta_.tmp_path = self.path + "tmp/"
+        build.SBoGrep = _Checksums
+        self.installed = []
+
+    def tearDown(self):
+        (_meta_.output, _meta_.log_path, _meta_.tmp_path,
+         build.SBoGrep) = self.saved
+        shutil.rmtree(self.path)
+
+    def slackbuild(self, name, commands=PACKAGE):
+        """Write SlackBuild archive and return build item
+        """
+        os.mkdir(self.path + name)
+        script = self.path + name + "/" + name + ".SlackBuild"
+        with open(script, "w") as f:
+            f.write(SLACKBUILD.format(name, commands))
+        with tarfile.open(self.path + name + ".tar.gz", "w:gz") as tar:
+            tar.add(self.path + name, name)
+        shutil.rmtree(self.path + name)
+        return (name + "-1.0", name, BuildPackage(name + ".tar.gz", [],
+                                                  self.path, auto=True,
+                                                  quiet=True))
+
+    def install(self, prgnam, binary):
+        self.installed.append((prgnam, binary))
+
+    def test_build(self):
+        builds = [self.slackbuild(name) for name in ["a", "b", "c"]]
+        deps = {"c": ["a"]}
+        self.assertTrue(BuildScheduler(builds, deps, 3).run(self.install))
+        self.assertEqual(sorted(self.installed), [
+            ("{0}-1.0".format(name), [_meta_.output +
+                                      "{0}-1.0-noarch-1_SBo.tgz".format(name)])
+            for name in ["a", "b", "c"]])
+        self.assertTrue(self.installed.index(
+            ("a-1.0", [_meta_.output + "a-1.0-noarch-1_SBo.tgz"])) <
+            self.installed.index(
+                ("c-1.0", [_meta_.output + "c-1.0-noarch-1_SBo.tgz"])))
+        for name in ["a", "b", "c"]:
+            with open("{0}jobs/{1}-1.0/tmp/package-{1}/tmp".format(
+                    _meta_.tmp_path, name)) as f:
+                self.assertEqual(f.read(), "{0}jobs/{1}-1.0/tmp/\n".format(
+                    _meta_.tmp_path, name))
+
+    def test_failed(self):
+        builds = [self.slackbuild("a", "exit 1"), self.slackbuild("b")]
+        self.assertFalse(BuildScheduler(builds, {"b": ["a"]}, 2).run(
+            self.install))
+        self.assertEqual(self.installed, [])
+
+    def test_no_package(self):
+        builds = [self.slackbuild("a", "true")]
+        self.assertFalse(BuildScheduler(builds, {}, 2).run(self.install))
+        self.assertEqual(self.installed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()